@@ -8,7 +8,7 @@ DATA_FILE = "pokemon_tracker_data.json"
 NAMES_CACHE_FILE = "pokemon_names_cache.json"
 ITEMS_PER_PAGE = 25  # Reduced from 50 for better performance
 MAX_CONCURRENT_LOADS = 6
-SPRITE_LOAD_DELAY = 0.0
+MAX_SPRITE_CACHE = 400  # Decoded sprites kept in memory (LRU); covers a couple of regions
 
 # API configuration
 API_BASE_URL = "https://pokeapi.co/api/v2"
@@ -18,8 +18,16 @@ API_POKEMON_URL = f"{API_BASE_URL}/pokemon"
 # User agent for API requests
 USER_AGENT = "NationalDexTracker/1.0"
 
+# HTTP connection pooling
+HTTP_POOL_CONNECTIONS = 4  # Distinct hosts kept alive (pokeapi.co, raw.githubusercontent.com)
+HTTP_POOL_MAXSIZE = 32  # Keep-alive connections per host
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+
 # Caching configuration
 SPRITE_CACHE_DIR = ".sprite_cache"
+SPRITE_CACHE_DB = "sprite_cache.sqlite"  # Single-file sprite store inside SPRITE_CACHE_DIR
+SPRITE_URL_CACHE_FILE = "url_cache.json"  # Variant sprite URLs resolved via PokéAPI
 CACHE_REFRESH_DAYS = 7  # Refresh sprites weekly
 CACHE_VERSION = "1.0"  # Increment to force cache rebuild
 
@@ -1,12 +1,80 @@
 """Pokemon database and name management."""
 
+import hashlib
 import json
 import os
+import threading
 import requests
+from functools import lru_cache
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
 from tkinter import messagebox
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple
+from urllib3.util.retry import Retry
 
-from constants import TOTAL_POKEMON, NAMES_CACHE_FILE, USER_AGENT, API_POKEMON_LIMIT_URL
+from constants import (
+    TOTAL_POKEMON, NAMES_CACHE_FILE, USER_AGENT, API_POKEMON_LIMIT_URL, SPRITE_BASE_URL,
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF
+)
+
+# Read-only lookup tables, module-level so hot paths avoid class attribute loads
+_SPECIAL_NAME_FIXES = MappingProxyType({
+    "mr-mime": "Mr. Mime",
+    "mime-jr": "Mime Jr.",
+    "type-null": "Type: Null",
+    "tapu-koko": "Tapu Koko",
+    "tapu-lele": "Tapu Lele",
+    "tapu-bulu": "Tapu Bulu",
+    "tapu-fini": "Tapu Fini",
+    "ho-oh": "Ho-Oh",
+    "porygon-z": "Porygon-Z",
+    "jangmo-o": "Jangmo-o",
+    "hakamo-o": "Hakamo-o",
+    "kommo-o": "Kommo-o",
+    "chien-pao": "Chien-Pao",
+    "ting-lu": "Ting-Lu",
+    "wo-chien": "Wo-Chien",
+    "chi-yu": "Chi-Yu",
+})
+
+_VARIANT_SUFFIX = MappingProxyType({
+    "Alolan": "alola",
+    "Galarian": "galar",
+    "Hisuian": "hisui",
+    "Paldean": "paldea",
+    # Vivillon patterns (PokeAPI slugs)
+    "Meadow": "meadow",
+    "Polar": "polar",
+    "Tundra": "tundra",
+    "Continental": "continental",
+    "Garden": "garden",
+    "Elegant": "elegant",
+    "Icy Snow": "icy-snow",
+    "Modern": "modern",
+    "Marine": "marine",
+    "Archipelago": "archipelago",
+    "High Plains": "high-plains",
+    "Sandstorm": "sandstorm",
+    "River": "river",
+    "Monsoon": "monsoon",
+    "Savanna": "savanna",
+    "Sun": "sun",
+    "Ocean": "ocean",
+    "Jungle": "jungle",
+    "Fancy": "fancy",
+    "Poké Ball": "poke-ball",
+})
+
+
+@lru_cache(maxsize=2048)
+def _slug_to_display(slug: str, _fixes=_SPECIAL_NAME_FIXES) -> str:
+    """Convert API slug to display name (pure, so memoized across refreshes)."""
+    fixed = _fixes.get(slug)
+    if fixed is not None:
+        return fixed
+    # Capitalize each hyphen-separated word; unlike str.title() this leaves
+    # letters after digits/apostrophes alone
+    return " ".join([word[:1].upper() + word[1:] for word in slug.split("-")])
 
 
 class PokemonDatabase:
@@ -14,14 +82,23 @@ class PokemonDatabase:
     Handles Pokemon names, slugs, and variant metadata.
     Manages caching and API interactions with PokeAPI.
     """
-    NAME_CACHE: Dict[int, str] = {}      # id -> display name
-    SLUG_CACHE: Dict[int, str] = {}      # id -> api slug (e.g., "mr-mime")
+    # Dense id-indexed lists (index 0 unused): id -> display name / api slug (e.g., "mr-mime")
+    NAME_CACHE: List[Optional[str]] = [None] * (TOTAL_POKEMON + 1)
+    SLUG_CACHE: List[Optional[str]] = [None] * (TOTAL_POKEMON + 1)
     
     # Persistent HTTP session for API calls
     _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()  # Sprite workers may ask for the session simultaneously
+    
+    # Fingerprint of the names cache file as last read/written
+    _last_hash: Optional[bytes] = None
+    
+    # HTTP validators for the name list, sent back as a conditional GET
+    _etag: Optional[str] = None
+    _last_modified: Optional[str] = None
 
     # Tiny built-in fallback for offline first-run
-    KANTO_NAMES = [
+    KANTO_NAMES = (
         "Bulbasaur","Ivysaur","Venusaur","Charmander","Charmeleon",
         "Charizard","Squirtle","Wartortle","Blastoise","Caterpie",
         "Metapod","Butterfree","Weedle","Kakuna","Beedrill",
@@ -53,131 +130,154 @@ class PokemonDatabase:
         "Kabutops","Aerodactyl","Snorlax","Articuno","Zapdos",
         "Moltres","Dratini","Dragonair","Dragonite","Mewtwo",
         "Mew"
-    ]
+    )
 
     # Variants we want rows for (extend as you like)
     REGIONAL_VARIANTS = {
-        19: ["Alolan"], 20: ["Alolan"], 26: ["Alolan"], 27: ["Alolan"], 28: ["Alolan"],
-        37: ["Alolan"], 38: ["Alolan"], 50: ["Alolan"], 51: ["Alolan"], 
-        52: ["Alolan", "Galarian"], 53: ["Alolan"], 74: ["Alolan"], 75: ["Alolan"], 
-        76: ["Alolan"], 88: ["Alolan"], 89: ["Alolan"], 103: ["Alolan"], 105: ["Alolan"],
+        19: ("Alolan",), 20: ("Alolan",), 26: ("Alolan",), 27: ("Alolan",), 28: ("Alolan",),
+        37: ("Alolan",), 38: ("Alolan",), 50: ("Alolan",), 51: ("Alolan",), 
+        52: ("Alolan", "Galarian"), 53: ("Alolan",), 74: ("Alolan",), 75: ("Alolan",), 
+        76: ("Alolan",), 88: ("Alolan",), 89: ("Alolan",), 103: ("Alolan",), 105: ("Alolan",),
         # Vivillon (id 666) forms tracked as variants (separate dex logic without UI changes)
-        666: [
+        666: (
             "Meadow", "Polar", "Tundra", "Continental", "Garden", "Elegant", "Icy Snow",
             "Modern", "Marine", "Archipelago", "High Plains", "Sandstorm", "River",
             "Monsoon", "Savanna", "Sun", "Ocean", "Jungle", "Fancy", "Poké Ball"
-        ]
+        )
     }
 
-    SPECIAL_NAME_FIXES = {
-        "mr-mime": "Mr. Mime",
-        "mime-jr": "Mime Jr.",
-        "type-null": "Type: Null",
-        "tapu-koko": "Tapu Koko",
-        "tapu-lele": "Tapu Lele",
-        "tapu-bulu": "Tapu Bulu",
-        "tapu-fini": "Tapu Fini",
-        "ho-oh": "Ho-Oh",
-        "porygon-z": "Porygon-Z",
-        "jangmo-o": "Jangmo-o",
-        "hakamo-o": "Hakamo-o",
-        "kommo-o": "Kommo-o",
-        "chien-pao": "Chien-Pao",
-        "ting-lu": "Ting-Lu",
-        "wo-chien": "Wo-Chien",
-        "chi-yu": "Chi-Yu",
-    }
+    # Base-form sprite URLs by dex number (index 0 unused), built once at import
+    SPRITE_URLS = tuple(f"{SPRITE_BASE_URL}/{i}.png" for i in range(TOTAL_POKEMON + 1))
+    SHINY_SPRITE_URLS = tuple(f"{SPRITE_BASE_URL}/shiny/{i}.png" for i in range(TOTAL_POKEMON + 1))
 
-    VARIANT_SUFFIX = {
-        "Alolan": "alola",
-        "Galarian": "galar",
-        "Hisuian": "hisui",
-        "Paldean": "paldea",
-        # Vivillon patterns (PokeAPI slugs)
-        "Meadow": "meadow",
-        "Polar": "polar",
-        "Tundra": "tundra",
-        "Continental": "continental",
-        "Garden": "garden",
-        "Elegant": "elegant",
-        "Icy Snow": "icy-snow",
-        "Modern": "modern",
-        "Marine": "marine",
-        "Archipelago": "archipelago",
-        "High Plains": "high-plains",
-        "Sandstorm": "sandstorm",
-        "River": "river",
-        "Monsoon": "monsoon",
-        "Savanna": "savanna",
-        "Sun": "sun",
-        "Ocean": "ocean",
-        "Jungle": "jungle",
-        "Fancy": "fancy",
-        "Poké Ball": "poke-ball",
-    }
+    # Kept as class attributes for API compatibility
+    SPECIAL_NAME_FIXES = _SPECIAL_NAME_FIXES
+    VARIANT_SUFFIX = _VARIANT_SUFFIX
     
     @classmethod
     def get_session(cls) -> requests.Session:
-        """Get or create the HTTP session."""
+        """Get or create the HTTP session with a pooled, retrying adapter."""
         if cls._session is None:
-            cls._session = requests.Session()
-            cls._session.headers.update({"User-Agent": USER_AGENT})
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    session.headers.update({"User-Agent": USER_AGENT})
+                    # Only transient 5xx answers are retried; connection errors and read
+                    # timeouts fail at once so an offline first run doesn't stall
+                    retry = Retry(
+                        total=HTTP_MAX_RETRIES,
+                        connect=0,
+                        read=0,
+                        backoff_factor=HTTP_RETRY_BACKOFF,
+                        status_forcelist=[502, 503, 504]
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=HTTP_POOL_CONNECTIONS,
+                        pool_maxsize=HTTP_POOL_MAXSIZE,
+                        max_retries=retry
+                    )
+                    session.mount("https://", adapter)
+                    cls._session = session
         return cls._session
 
-    @classmethod
-    def _slug_to_display(cls, slug: str) -> str:
-        """Convert API slug to display name."""
-        if slug in cls.SPECIAL_NAME_FIXES:
-            return cls.SPECIAL_NAME_FIXES[slug]
-        return slug.replace("-", " ").title()
+    _slug_to_display = staticmethod(_slug_to_display)
+
+    @staticmethod
+    def _dense_from_mapping(mapping: dict) -> List[Optional[str]]:
+        """Build an id-indexed list from the on-disk {"id": value} mapping."""
+        dense: List[Optional[str]] = [None] * (TOTAL_POKEMON + 1)
+        for key, value in mapping.items():
+            pokemon_id = int(key)
+            if 0 < pokemon_id <= TOTAL_POKEMON:
+                dense[pokemon_id] = value
+        return dense
+
+    @staticmethod
+    def _mapping_from_dense(dense: List[Optional[str]]) -> dict:
+        """Inverse of _dense_from_mapping, skipping unknown ids."""
+        return {str(i): value for i, value in enumerate(dense) if value is not None}
+
+    @staticmethod
+    def _content_hash(payload: bytes) -> bytes:
+        """Cheap fingerprint used to skip rewriting an unchanged cache file."""
+        return hashlib.blake2b(payload, digest_size=16).digest()
 
     @classmethod
     def _load_cache_from_disk(cls) -> None:
         """Load cached names and slugs from disk."""
         if os.path.exists(NAMES_CACHE_FILE):
             try:
-                with open(NAMES_CACHE_FILE, "r", encoding="utf-8") as f:
-                    raw = json.load(f)
-                names = raw.get("names", {})
-                slugs = raw.get("slugs", {})
-                cls.NAME_CACHE = {int(k): v for k, v in names.items()}
-                cls.SLUG_CACHE = {int(k): v for k, v in slugs.items()}
+                with open(NAMES_CACHE_FILE, "rb") as f:
+                    payload = f.read()
+                raw = json.loads(payload)
+                cls.NAME_CACHE = cls._dense_from_mapping(raw.get("names", {}))
+                cls.SLUG_CACHE = cls._dense_from_mapping(raw.get("slugs", {}))
+                cls._etag = raw.get("etag")
+                cls._last_modified = raw.get("last_modified")
+                cls._last_hash = cls._content_hash(payload)
             except Exception:
-                cls.NAME_CACHE = {}
-                cls.SLUG_CACHE = {}
+                cls.NAME_CACHE = [None] * (TOTAL_POKEMON + 1)
+                cls.SLUG_CACHE = [None] * (TOTAL_POKEMON + 1)
 
     @classmethod
     def _save_cache_to_disk(cls) -> None:
-        """Save cached names and slugs to disk."""
+        """Save cached names and slugs to disk, skipping the write if nothing changed."""
         try:
-            with open(NAMES_CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump({
-                    "names": cls.NAME_CACHE, 
-                    "slugs": cls.SLUG_CACHE
-                }, f, ensure_ascii=False, indent=2)
+            # Keyed by id string on disk, the format the legacy tracker also reads.
+            # Machine-read file: compact separators keep it small and fast to parse
+            payload = json.dumps({
+                "names": cls._mapping_from_dense(cls.NAME_CACHE), 
+                "slugs": cls._mapping_from_dense(cls.SLUG_CACHE),
+                "etag": cls._etag,
+                "last_modified": cls._last_modified
+            }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            content_hash = cls._content_hash(payload)
+            if content_hash == cls._last_hash and os.path.exists(NAMES_CACHE_FILE):
+                return
+            # Write to a temp file and swap it in so a crash never leaves a torn cache
+            tmp_path = f"{NAMES_CACHE_FILE}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, NAMES_CACHE_FILE)
+            cls._last_hash = content_hash
         except Exception:
             pass
 
     @classmethod
-    def refresh_cache(cls, show_errors: bool = True) -> None:
-        """Refresh Pokemon names cache from PokeAPI."""
+    def download_names(cls) -> None:
+        """Download Pokemon names from PokeAPI and update the cache, raising on failure."""
+        session = cls.get_session()
+        headers = {}
+        # Only revalidate a complete cache; a partial one needs the full body
+        if None not in cls.NAME_CACHE[1:] and None not in cls.SLUG_CACHE[1:]:
+            if cls._etag:
+                headers["If-None-Match"] = cls._etag
+            if cls._last_modified:
+                headers["If-Modified-Since"] = cls._last_modified
+        resp = session.get(API_POKEMON_LIMIT_URL, headers=headers, timeout=8)
+        if resp.status_code == 304:
+            return  # Cached names are current
+        resp.raise_for_status()
+        data = resp.json()
+        results = data.get("results", [])
+        if not results:
+            raise ValueError("No results from PokéAPI")
+        
+        slugs = [entry.get("name", "") for entry in results[:TOTAL_POKEMON]]
+        padding = [None] * (TOTAL_POKEMON - len(slugs))
+        cls.SLUG_CACHE = [None] + slugs + padding
+        cls.NAME_CACHE = [None] + [cls._slug_to_display(slug) for slug in slugs] + padding
+        cls._etag = resp.headers.get("ETag")
+        cls._last_modified = resp.headers.get("Last-Modified")
+        
+        cls._save_cache_to_disk()
+
+    @classmethod
+    def refresh_cache(cls, show_errors: bool = True) -> bool:
+        """Refresh Pokemon names cache from PokeAPI. Returns True on success."""
         try:
-            session = cls.get_session()
-            resp = session.get(API_POKEMON_LIMIT_URL, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
-            results = data.get("results", [])
-            if not results:
-                raise ValueError("No results from PokéAPI")
-            
-            cls.NAME_CACHE = {}
-            cls.SLUG_CACHE = {}
-            for idx, entry in enumerate(results, start=1):
-                slug = entry.get("name", "")
-                cls.SLUG_CACHE[idx] = slug
-                cls.NAME_CACHE[idx] = cls._slug_to_display(slug)
-            
-            cls._save_cache_to_disk()
+            cls.download_names()
+            return True
         except Exception as e:
             if show_errors:
                 try:
@@ -188,29 +288,41 @@ class PokemonDatabase:
                     )
                 except Exception:
                     pass
+            return False
 
     @classmethod
     def initialize_names(cls) -> None:
         """Initialize Pokemon names, loading from cache or API."""
         cls._load_cache_from_disk()
-        if len(cls.NAME_CACHE) < TOTAL_POKEMON or len(cls.SLUG_CACHE) < TOTAL_POKEMON:
+        if None in cls.NAME_CACHE[1:] or None in cls.SLUG_CACHE[1:]:
             cls.refresh_cache(show_errors=False)
+        # Fold the offline fallback in once so get_name is a single lookup
+        for pokemon_id, name in enumerate(cls.KANTO_NAMES, start=1):
+            if cls.NAME_CACHE[pokemon_id] is None:
+                cls.NAME_CACHE[pokemon_id] = name
 
     @classmethod
     def get_name(cls, pokemon_id: int) -> str:
         """Get Pokemon name by ID."""
-        if pokemon_id in cls.NAME_CACHE:
-            return cls.NAME_CACHE[pokemon_id]
-        if 1 <= pokemon_id <= len(cls.KANTO_NAMES):
-            return cls.KANTO_NAMES[pokemon_id - 1]
+        if 0 < pokemon_id <= TOTAL_POKEMON:
+            name = cls.NAME_CACHE[pokemon_id]
+            if name:
+                return name
         return f"Pokemon {pokemon_id}"
 
     @classmethod
     def get_slug(cls, pokemon_id: int) -> Optional[str]:
         """Get Pokemon API slug by ID."""
-        return cls.SLUG_CACHE.get(pokemon_id)
+        return cls.SLUG_CACHE[pokemon_id] if 0 < pokemon_id <= TOTAL_POKEMON else None
+
+    @classmethod
+    def get_sprite_url(cls, pokemon_id: int, shiny: bool) -> str:
+        """Get the base-form sprite URL for a Pokemon ID."""
+        if 0 < pokemon_id <= TOTAL_POKEMON:
+            return cls.SHINY_SPRITE_URLS[pokemon_id] if shiny else cls.SPRITE_URLS[pokemon_id]
+        return f"{SPRITE_BASE_URL}/shiny/{pokemon_id}.png" if shiny else f"{SPRITE_BASE_URL}/{pokemon_id}.png"
 
     @classmethod
-    def get_variants(cls, pokemon_id: int) -> List[str]:
-        """Get list of regional variants for a Pokemon ID."""
-        return cls.REGIONAL_VARIANTS.get(pokemon_id, [])
+    def get_variants(cls, pokemon_id: int) -> Tuple[str, ...]:
+        """Get the regional variants for a Pokemon ID."""
+        return cls.REGIONAL_VARIANTS.get(pokemon_id, ())
@@ -1,20 +1,57 @@
 """Dialog windows for the Pokemon tracker application."""
 
+import os
+import platform
 from tkinter import messagebox
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 import customtkinter as ctk
 
 from constants import ITEMS_PER_PAGE, APP_ICON, APP_ICON_PNG, APP_ICON_ICNS
 from models import Pokemon
-import os
-import platform
+
+# Platform and icon files don't change during a session; resolve them once
+_IS_MACOS = platform.system() == "Darwin"
+_ICNS_PATH = APP_ICON_ICNS if os.path.exists(APP_ICON_ICNS) else None
+_ICO_PATH = APP_ICON if os.path.exists(APP_ICON) else None
+_PNG_PATH = APP_ICON_PNG if os.path.exists(APP_ICON_PNG) else None
+
+
+class SearchIndex:
+    """Lowercased ids/names of a Pokémon list, built once and reused by every search."""
+    
+    __slots__ = ("_ids_lower", "_names_lower", "_exact_lookup")
+    
+    def __init__(self, pokemon_list: List[Pokemon]):
+        self._ids_lower = [p.display_id.lower() for p in pokemon_list]
+        self._names_lower = [p.name.lower() for p in pokemon_list]
+        self._exact_lookup = {}
+        # Reverse so the first occurrence wins (variants share their base name)
+        for i in range(len(pokemon_list) - 1, -1, -1):
+            self._exact_lookup[self._names_lower[i]] = i
+            self._exact_lookup[self._ids_lower[i]] = i
+    
+    def find(self, query: str) -> Optional[int]:
+        """Return the list index of the best match: exact id/name first, then substring."""
+        if query.isdigit():
+            # Dex numbers may be typed zero-padded ("025")
+            query = str(int(query))
+        index = self._exact_lookup.get(query)
+        if index is not None:
+            return index
+        for i, name in enumerate(self._names_lower):
+            if query in name or query in self._ids_lower[i]:
+                return i
+        return None
 
 
 class QuickSearchDialog:
     """Dialog for quickly searching Pokemon by name or number."""
     
-    def __init__(self, parent: ctk.CTk, pokemon_list: List[Pokemon], callback: Callable[[int], None]):
+    __slots__ = ("dialog", "callback", "search_entry", "_index")
+    
+    def __init__(self, parent: ctk.CTk, pokemon_list: List[Pokemon], callback: Callable[[int], None],
+                 index: Optional[SearchIndex] = None):
         """
         Initialize the quick search dialog.
         
@@ -22,6 +59,7 @@ class QuickSearchDialog:
             parent: Parent window
             pokemon_list: List of Pokemon to search through
             callback: Function to call with page number when Pokemon is found
+            index: Prebuilt index of pokemon_list; built here when omitted
         """
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Quick Search")
@@ -29,8 +67,8 @@ class QuickSearchDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        self.pokemon_list = pokemon_list
         self.callback = callback
+        self._index = index if index is not None else SearchIndex(pokemon_list)
         
         self._setup_ui()
     
@@ -67,13 +105,11 @@ class QuickSearchDialog:
         if not query:
             return
         
-        for i, pokemon in enumerate(self.pokemon_list):
-            if (query in pokemon.display_id.lower() or 
-                query in pokemon.name.lower()):
-                page = i // ITEMS_PER_PAGE
-                self.callback(page)
-                self.dialog.destroy()
-                return
+        index = self._index.find(query)
+        if index is not None:
+            self.callback(index // ITEMS_PER_PAGE)
+            self.dialog.destroy()
+            return
         
         messagebox.showinfo(
             "Not Found", 
@@ -84,6 +120,8 @@ class QuickSearchDialog:
 class CSVExportDialog:
     """Dialog for choosing CSV export options."""
     
+    __slots__ = ("dialog", "current_region_name", "callback", "result")
+    
     def __init__(self, parent: ctk.CTk, current_region_name: str, callback: Callable[[str], None]):
         """
         Initialize the CSV export dialog.
@@ -210,42 +248,25 @@ class CSVExportDialog:
     
     def _set_dialog_icon(self) -> None:
         """Set the dialog icon to match the main application."""
-        is_macos = platform.system() == 'Darwin'
+        # macOS prefers the native ICNS, Windows/Linux the ICO
+        native_path = _ICNS_PATH if _IS_MACOS else _ICO_PATH
+        platform_label = "macOS dialog" if _IS_MACOS else "Dialog"
         
-        if is_macos:
-            # macOS-specific icon handling
-            try:
-                if os.path.exists(APP_ICON_ICNS):
-                    self.dialog.iconbitmap(APP_ICON_ICNS)
-                    return
-            except Exception as e:
-                print(f"macOS dialog ICNS failed: {e}")
-            
+        if native_path:
             try:
-                if os.path.exists(APP_ICON_PNG):
-                    from tkinter import PhotoImage
-                    icon_img = PhotoImage(file=APP_ICON_PNG)
-                    self.dialog.iconphoto(True, icon_img)
-                    return
-            except Exception as e:
-                print(f"macOS dialog PNG failed: {e}")
-        else:
-            # Windows/Linux icon handling
-            try:
-                if os.path.exists(APP_ICON):
-                    self.dialog.iconbitmap(APP_ICON)
-                    return
+                self.dialog.iconbitmap(native_path)
+                return
             except Exception as e:
-                print(f"Dialog ICO failed: {e}")
-            
+                print(f"{platform_label} {'ICNS' if _IS_MACOS else 'ICO'} failed: {e}")
+        
+        if _PNG_PATH:
             try:
-                if os.path.exists(APP_ICON_PNG):
-                    from tkinter import PhotoImage
-                    icon_img = PhotoImage(file=APP_ICON_PNG)
-                    self.dialog.iconphoto(True, icon_img)
-                    return
+                from tkinter import PhotoImage
+                icon_img = PhotoImage(file=_PNG_PATH)
+                self.dialog.iconphoto(True, icon_img)
+                return
             except Exception as e:
-                print(f"Dialog PNG failed: {e}")
+                print(f"{platform_label} PNG failed: {e}")
     
     def _export_region(self) -> None:
         """Export current region data."""
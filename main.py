@@ -9,37 +9,49 @@ from tkinter import messagebox
 import customtkinter as ctk
 
 from database import PokemonDatabase
-from dialogs import QuickSearchDialog
+from dialogs import QuickSearchDialog, SearchIndex
 from main_app import PokemonTracker
 
 
 def main():
     """Main entry point for the Pokemon Tracker application."""
     root = ctk.CTk()
+    refresh_lock = threading.Lock()
+    # SearchIndex for the current pokemon_list, keyed by identity (the list is never mutated after startup)
+    search_cache = {"list": None, "index": None}
 
     def refresh_names():
         """Refresh Pokemon names from PokéAPI."""
+        if refresh_lock.locked():
+            return  # A refresh is already running; don't stack another worker
         if not messagebox.askyesno("Refresh Names", "Re-download all Pokémon names from PokéAPI?"):
             return
+        if not refresh_lock.acquire(blocking=False):
+            return
         
         def _do_refresh():
+            # Runs on a worker thread: only touch Tk through root.after
             try:
-                PokemonDatabase.refresh_cache()
-                try:
-                    root.after(0, lambda: messagebox.showinfo(
-                        "Success", 
-                        "Names refreshed! Please restart the app for a full rebuild."
-                    ))
-                except Exception:
-                    pass
+                PokemonDatabase.download_names()
             except Exception as e:
+                reason = str(e)
                 try:
                     root.after(0, lambda: messagebox.showwarning(
                         "Refresh Failed", 
-                        f"Could not refresh names.\n\n{e}"
+                        f"Could not refresh names.\n\n{reason}"
                     ))
                 except Exception:
                     pass
+                return
+            finally:
+                refresh_lock.release()
+            try:
+                root.after(0, lambda: messagebox.showinfo(
+                    "Success", 
+                    "Names refreshed! Please restart the app for a full rebuild."
+                ))
+            except Exception:
+                pass
         
         threading.Thread(target=_do_refresh, daemon=True).start()
 
@@ -49,7 +61,10 @@ def main():
             def go_to_page(page):
                 app.current_page = page
                 app._update_display()
-            QuickSearchDialog(root, app.pokemon_list, go_to_page)
+            if search_cache["list"] is not app.pokemon_list:
+                search_cache["list"] = app.pokemon_list
+                search_cache["index"] = SearchIndex(app.pokemon_list)
+            QuickSearchDialog(root, app.pokemon_list, go_to_page, search_cache["index"])
 
     # Bind keyboard shortcuts
     root.bind('<Control-f>', lambda e: open_search())
@@ -1,11 +1,13 @@
 """Main Pokemon Tracker application."""
 
-from tkinter import messagebox
-from typing import List, Tuple, Dict
-import hashlib
-import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import islice
+from tkinter import messagebox, PhotoImage
+from typing import Callable, List, Tuple, Dict, Optional
 import os
 import platform
+import threading
 
 import customtkinter as ctk
 
@@ -17,7 +19,82 @@ from constants import (
 from database import PokemonDatabase
 from dialogs import CSVExportDialog
 from managers import LazyLoadSpriteManager, DataManager
-from models import Pokemon, Mode, Region, ViewFilter
+from models import Pokemon, Mode, Region, ViewFilter, REGION_BY_NAME, FILTER_BY_VALUE
+
+_SYSTEM = platform.system()
+
+# Card background by (is_captured, is_variant); shared by card population, toggles and refreshes
+_CARD_COLORS = {
+    (True, False): COLORS["captured"],
+    (True, True): COLORS["captured"],
+    (False, True): COLORS["variant"],
+    (False, False): COLORS["card_default"],
+}
+
+
+def _existing_abspath(path: str) -> Optional[str]:
+    """Return the absolute path of an asset, or None if it is missing."""
+    return os.path.abspath(path) if os.path.exists(path) else None
+
+
+_ABS_ICNS = _existing_abspath(APP_ICON_ICNS)
+_ABS_ICO = _existing_abspath(APP_ICON)
+_ABS_PNG = _existing_abspath(APP_ICON_PNG)
+
+if _SYSTEM == 'Darwin':
+    try:
+        from Cocoa import NSApplication, NSImage
+    except ImportError:
+        NSApplication = NSImage = None
+        print("PyObjC not available, falling back to tkinter methods")
+
+
+def _set_icon_cocoa(root: ctk.CTk) -> None:
+    """Set the macOS dock icon from the ICNS file via Cocoa."""
+    ns_image = NSImage.alloc().initWithContentsOfFile_(_ABS_ICNS)
+    if not ns_image:
+        raise RuntimeError(f"could not create NSImage from {_ABS_ICNS}")
+    NSApplication.sharedApplication().setApplicationIconImage_(ns_image)
+
+
+def _set_icon_ico(root: ctk.CTk) -> None:
+    """Set the window icon from the ICO file."""
+    root.iconbitmap(_ABS_ICO)
+
+
+def _set_icon_png(root: ctk.CTk) -> None:
+    """Set the window icon from the PNG file."""
+    root.iconphoto(True, PhotoImage(file=_ABS_PNG))
+
+
+def _pick_icon_loaders() -> Tuple[Tuple[str, Callable[[ctk.CTk], None]], ...]:
+    """Pick the icon loaders usable on this platform, best first."""
+    loaders = []
+    if _SYSTEM == 'Darwin':
+        if NSApplication is not None and _ABS_ICNS:
+            loaders.append(("Cocoa/ICNS", _set_icon_cocoa))
+    elif _ABS_ICO:
+        loaders.append(("ICO file", _set_icon_ico))
+    if _ABS_PNG:
+        loaders.append(("PNG iconphoto", _set_icon_png))
+    return tuple(loaders)
+
+
+_ICON_LOADERS = _pick_icon_loaders()
+
+
+@dataclass
+class CardWidgets:
+    """Widgets that make up one reusable Pokemon card row."""
+    frame: ctk.CTkFrame
+    id_label: ctk.CTkLabel
+    sprite_label: ctk.CTkLabel
+    name_label: ctk.CTkLabel
+    checkbox: ctk.CTkCheckBox
+    var: ctk.BooleanVar
+    pokemon: Optional[Pokemon] = None
+    visible: bool = False  # Mirrors grid state so page turns skip redundant grid()/grid_remove()
+    color: Optional[Tuple[str, str]] = None  # Last fg_color applied, so unchanged cards skip configure()
 
 
 class PokemonTracker:
@@ -42,22 +119,38 @@ class PokemonTracker:
         self.current_page = 0
         self.total_pages = 0
         self.card_widgets: List[Tuple] = []
+        self._card_pool: List[Optional[CardWidgets]] = []  # One slot per row, built on first use
         self.view_filter = ViewFilter.ALL
         
         # Performance optimization flags
         self._loading = False
         self._region_switch_pending = None
+        self._scroll_pending = False  # Coalesces bursts of wheel events into one visibility update
+        self._save_pending = None  # after() id of the debounced DataManager.save_async
+        self._refresh_pending = None  # after() id of the debounced progress refresh
+        self._export_in_flight = False  # A CSV export is being written on a worker thread
         
         # Region UI state caching
         self._region_cache: Dict[str, Dict] = {}  # Cache UI state for each region/mode/filter combo
-        self._cache_data_hash = None  # Hash of pokemon_list to detect data changes
+        self._data_version = 0  # Bumped on every capture change; cached states record it
+        
+        # Filtered views by (region, mode, filter); at most 60 lists, all dropped on a capture change
+        self._filtered_views: Dict[Tuple[Region, Mode, ViewFilter], List[Pokemon]] = {}
+        self._progress_cache_key = None  # (region, mode, data_version) of the memoized captured count
+        self._progress_cache_value = 0
         
         # Pre-create font objects to avoid repeated creation
         self._font_cache = {
             'id_font': ctk.CTkFont(size=14, weight="bold"),
             'name_font_normal': ctk.CTkFont(size=16, weight="normal"),
             'name_font_bold': ctk.CTkFont(size=16, weight="bold"),
-            'checkbox_font': ctk.CTkFont(size=12)
+            'checkbox_font': ctk.CTkFont(size=12),
+            'title_font': ctk.CTkFont(size=28, weight="bold"),
+            'label_bold_16': ctk.CTkFont(size=16, weight="bold"),
+            'label_12': ctk.CTkFont(size=12),
+            'progress_font': ctk.CTkFont(size=14, weight="bold"),
+            'page_info_font': ctk.CTkFont(size=14, weight="bold"),
+            'loading_font': ctk.CTkFont(size=18, weight="bold")
         }
         
         # Setup application
@@ -65,103 +158,35 @@ class PokemonTracker:
         DataManager.load(self.pokemon_list)
         self._setup_ui()
         self._update_display()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Warm variant sprite URLs once the first page is up
+        self.root.after(1000, lambda: self.sprite_manager.prefetch_variant_urls(self.pokemon_list))
+    
+    def _on_close(self) -> None:
+        """Flush unsaved captures, release background workers and close the window."""
+        if self._save_pending:
+            self._flush_save()
+        # The writer thread is a daemon; give it a bounded chance to finish so a hung disk can't block closing
+        if not DataManager.wait_for_saves():
+            print("Warning: capture data was still being written when the window closed")
+        self.sprite_manager.shutdown()
+        self.root.destroy()
     
     def _set_app_icon(self) -> None:
-        """Set the application icon with platform-specific optimizations."""
-        is_macos = platform.system() == 'Darwin'
-        
-        print(f"Setting icon on {platform.system()}...")
-        
-        # macOS-specific icon handling using Cocoa
-        if is_macos:
-            # Method 1: Use PyObjC/Cocoa to properly set dock icon
+        """Set the application icon using the loaders picked at import time."""
+        for description, loader in _ICON_LOADERS:
             try:
-                import AppKit
-                from Cocoa import NSApplication, NSImage, NSBundle
-                
-                # Get the shared NSApplication instance
-                app = NSApplication.sharedApplication()
-                
-                # Create NSImage from our icon file
-                icon_path = os.path.abspath(APP_ICON_ICNS)
-                if os.path.exists(icon_path):
-                    # Load the ICNS file into NSImage
-                    ns_image = NSImage.alloc().initWithContentsOfFile_(icon_path)
-                    if ns_image:
-                        # Set the application icon (this sets the dock icon properly!)
-                        app.setApplicationIconImage_(ns_image)
-                        print(f"✅ macOS: Dock icon set using Cocoa/ICNS: {icon_path}")
-                        return
-                    else:
-                        print(f"Failed to create NSImage from: {icon_path}")
-                        
-            except ImportError:
-                print("PyObjC not available, falling back to tkinter methods")
-            except Exception as e:
-                print(f"Cocoa method failed: {e}")
-            
-            # Method 2: Fallback to tkinter iconphoto with high-res PNG
-            try:
-                if os.path.exists(APP_ICON_PNG):
-                    from tkinter import PhotoImage
-                    icon_img = PhotoImage(file=APP_ICON_PNG)
-                    self.root.iconphoto(True, icon_img)
-                    print(f"✅ macOS: Window icon set using PNG iconphoto: {APP_ICON_PNG}")
-                    print("   Note: macOS dock icon requires Cocoa/PyObjC for proper display")
-                    return
-            except Exception as e:
-                print(f"macOS PNG iconphoto failed: {e}")
-        
-        # Windows/Linux icon handling
-        else:
-            # Method 1: Try ICO file (best for Windows) with absolute path
-            try:
-                if os.path.exists(APP_ICON):
-                    abs_icon_path = os.path.abspath(APP_ICON)
-                    self.root.iconbitmap(abs_icon_path)
-                    print(f"✅ {platform.system()}: Icon set using ICO file: {abs_icon_path}")
-                    return
-            except Exception as e:
-                print(f"ICO icon failed: {e}")
-            
-            # Method 2: Try ICO with wm_iconbitmap (alternative Windows method)
-            try:
-                if os.path.exists(APP_ICON):
-                    abs_icon_path = os.path.abspath(APP_ICON)
-                    self.root.wm_iconbitmap(abs_icon_path)
-                    print(f"✅ {platform.system()}: Icon set using wm_iconbitmap: {abs_icon_path}")
-                    return
-            except Exception as e:
-                print(f"wm_iconbitmap failed: {e}")
-            
-            # Method 3: Try PNG fallback with iconphoto
-            try:
-                if os.path.exists(APP_ICON_PNG):
-                    from tkinter import PhotoImage
-                    abs_png_path = os.path.abspath(APP_ICON_PNG)
-                    icon_img = PhotoImage(file=abs_png_path)
-                    self.root.iconphoto(True, icon_img)
-                    print(f"✅ {platform.system()}: Icon set using PNG iconphoto: {abs_png_path}")
-                    return
-            except Exception as e:
-                print(f"PNG iconphoto failed: {e}")
-            
-            # Method 4: Try PNG with wm_iconphoto
-            try:
-                if os.path.exists(APP_ICON_PNG):
-                    from tkinter import PhotoImage
-                    abs_png_path = os.path.abspath(APP_ICON_PNG)
-                    icon_img = PhotoImage(file=abs_png_path)
-                    self.root.wm_iconphoto(True, icon_img)
-                    print(f"✅ {platform.system()}: Icon set using wm_iconphoto: {abs_png_path}")
-                    return
+                loader(self.root)
+                print(f"✅ {_SYSTEM}: Icon set using {description}")
+                return
             except Exception as e:
-                print(f"wm_iconphoto failed: {e}")
+                print(f"{description} failed: {e}")
         
         # If all methods failed
-        print(f"⚠️ Could not set application icon on {platform.system()}")
-        print(f"   Files exist - ICO: {os.path.exists(APP_ICON)}, PNG: {os.path.exists(APP_ICON_PNG)}, ICNS: {os.path.exists(APP_ICON_ICNS)}")
-        if is_macos:
+        print(f"⚠️ Could not set application icon on {_SYSTEM}")
+        print(f"   Files exist - ICO: {_ABS_ICO is not None}, PNG: {_ABS_PNG is not None}, ICNS: {_ABS_ICNS is not None}")
+        if _SYSTEM == 'Darwin':
             print(f"   macOS Note: tkinter apps have limited dock icon support. Consider using PyObjC or creating an .app bundle.")
     
     def _generate_pokemon_data(self) -> None:
@@ -180,6 +205,17 @@ class PokemonTracker:
                     is_variant=True,
                     region=variant
                 ))
+        
+        # The list is ordered by dex number, so each region is one contiguous slice
+        ids = [p.id for p in self.pokemon_list]
+        self._region_bounds: Dict[Region, Tuple[int, int]] = {
+            region: (bisect_left(ids, region.start), bisect_right(ids, region.end))
+            for region in Region
+        }
+        # The list never changes after startup, so materialize each region's members once
+        self._region_members: Dict[Region, List[Pokemon]] = {
+            region: self.pokemon_list[lo:hi] for region, (lo, hi) in self._region_bounds.items()
+        }
     
     def _setup_ui(self) -> None:
         """Setup the main UI components."""
@@ -195,17 +231,17 @@ class PokemonTracker:
         self._create_filter_selector()
         self._create_pagination_controls()
         self._create_main_area()
+        self._create_card_pool()
     
     def _create_header(self) -> None:
         """Create the application header."""
         header_frame = ctk.CTkFrame(self.root, height=HEADER_HEIGHT, corner_radius=10)
         header_frame.pack(fill="x", padx=20, pady=10)
-        header_frame.pack_propagate(False)
         
         self.title_label = ctk.CTkLabel(
             header_frame, 
             text="Pokémon Home Pokédex Tracker",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self._font_cache['title_font']
         )
         self.title_label.pack(pady=20)
     
@@ -213,12 +249,11 @@ class PokemonTracker:
         """Create mode selection controls (Normal/Shiny)."""
         mode_frame = ctk.CTkFrame(self.root, height=CONTROL_FRAME_HEIGHT, corner_radius=10)
         mode_frame.pack(fill="x", padx=20, pady=5)
-        mode_frame.pack_propagate(False)
         
         ctk.CTkLabel(
             mode_frame, 
             text="Mode:", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_cache['label_bold_16']
         ).pack(side="left", padx=20, pady=15)
         
         self.mode_var = ctk.StringVar(value=Mode.NORMAL.value)
@@ -234,13 +269,12 @@ class PokemonTracker:
         """Create control buttons."""
         controls_frame = ctk.CTkFrame(self.root, height=CONTROL_FRAME_HEIGHT, corner_radius=10)
         controls_frame.pack(fill="x", padx=20, pady=5)
-        controls_frame.pack_propagate(False)
         
         button_config = {
-            "Check All (Page)": (COLORS["captured"][0], COLORS["captured"][1], self._check_all_page),
-            "Uncheck All (Page)": ("red", "darkred", self._uncheck_all_page),
-            "Check All (Region)": (COLORS["region_check"][0], COLORS["region_check"][1], self._check_all_region),
-            "Uncheck All (Region)": (COLORS["region_uncheck"][0], COLORS["region_uncheck"][1], self._uncheck_all_region),
+            "Check All (Page)": (COLORS["captured"][0], COLORS["captured"][1], lambda: self._bulk_set_page(True)),
+            "Uncheck All (Page)": ("red", "darkred", lambda: self._bulk_set_page(False)),
+            "Check All (Region)": (COLORS["region_check"][0], COLORS["region_check"][1], lambda: self._bulk_set_region(True)),
+            "Uncheck All (Region)": (COLORS["region_uncheck"][0], COLORS["region_uncheck"][1], lambda: self._bulk_set_region(False)),
             "Download CSV": (COLORS["default"][0], COLORS["default"][1], self._download_csv)
         }
         
@@ -258,7 +292,7 @@ class PokemonTracker:
         self.progress_label = ctk.CTkLabel(
             controls_frame, 
             text="Progress: 0/0", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_cache['progress_font']
         )
         self.progress_label.pack(side="right", padx=20, pady=15)
 
@@ -266,12 +300,11 @@ class PokemonTracker:
         """Create filter selection controls."""
         filter_frame = ctk.CTkFrame(self.root, height=FILTER_FRAME_HEIGHT, corner_radius=10)
         filter_frame.pack(fill="x", padx=20, pady=5)
-        filter_frame.pack_propagate(False)
 
         ctk.CTkLabel(
             filter_frame, 
             text="Filter:", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_cache['label_bold_16']
         ).pack(side="left", padx=20, pady=12)
 
         self.filter_var = ctk.StringVar(value=ViewFilter.ALL.value)
@@ -286,14 +319,13 @@ class PokemonTracker:
         ctk.CTkLabel(
             filter_frame, 
             text="(Filter uses current Mode)", 
-            font=ctk.CTkFont(size=12)
+            font=self._font_cache['label_12']
         ).pack(side="left", padx=12)
 
     def _create_region_tabs(self) -> None:
         """Create region selection tabs."""
         tabs_frame = ctk.CTkFrame(self.root, height=FILTER_FRAME_HEIGHT, corner_radius=10)
         tabs_frame.pack(fill="x", padx=20, pady=5)
-        tabs_frame.pack_propagate(False)
         
         regions = [r.display_name for r in Region]
         self.region_var = ctk.StringVar(value=Region.KANTO.display_name)
@@ -309,7 +341,6 @@ class PokemonTracker:
         """Create pagination controls."""
         self.pagination_frame = ctk.CTkFrame(self.root, height=PAGINATION_FRAME_HEIGHT, corner_radius=10)
         self.pagination_frame.pack(fill="x", padx=20, pady=5)
-        self.pagination_frame.pack_propagate(False)
         
         self.prev_button = ctk.CTkButton(
             self.pagination_frame, 
@@ -323,7 +354,7 @@ class PokemonTracker:
         self.page_info_label = ctk.CTkLabel(
             self.pagination_frame, 
             text="Page 1 of 1", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font_cache['page_info_font']
         )
         self.page_info_label.pack(side="left", expand=True)
         
@@ -362,17 +393,37 @@ class PokemonTracker:
         self.main_scrollable = ctk.CTkScrollableFrame(self.main_frame, corner_radius=10)
         self.main_scrollable.pack(fill="both", expand=True, padx=10, pady=10)
         self.main_scrollable.grid_columnconfigure(0, weight=1)
-        self.main_scrollable.bind_all("<MouseWheel>", self._on_scroll)
         
         # Store reference to the internal canvas for scroll position control
-        self._canvas = None
-        for child in self.main_scrollable.winfo_children():
-            if hasattr(child, 'yview'):
-                self._canvas = child
-                break
+        self._canvas = getattr(self.main_scrollable, '_parent_canvas', None)
+        if self._canvas is None:
+            for child in self.main_scrollable.winfo_children():
+                if hasattr(child, 'yview'):
+                    self._canvas = child
+                    break
+        
+        # Cards sit inside the canvas, so their widget paths share its prefix; the frame's
+        # scrollbar is a sibling of the canvas, so wheeling over it needs its own prefix
+        scroll_paths = [str(self._canvas if self._canvas is not None else self.main_scrollable)]
+        scrollbar = getattr(self.main_scrollable, '_scrollbar', None)
+        if scrollbar is not None:
+            scroll_paths.append(str(scrollbar))
+        self._scroll_paths: Tuple[str, ...] = tuple(scroll_paths)
+        
+        # add="+" keeps CTkScrollableFrame's own wheel handler; Button-4/5 are X11 wheel events
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.main_scrollable.bind_all(sequence, self._on_scroll, add="+")
     
     def _on_scroll(self, event) -> None:
-        """Handle scroll events to update visible sprites."""
+        """Handle scroll events; visible sprites are recomputed at most every 30ms."""
+        if self._scroll_pending or not str(event.widget).startswith(self._scroll_paths):
+            return
+        self._scroll_pending = True
+        self.root.after(30, self._do_scroll_update)
+    
+    def _do_scroll_update(self) -> None:
+        """Run the coalesced visible-sprite update."""
+        self._scroll_pending = False
         self._update_visible_sprites()
     
     def _reset_scroll_position(self) -> None:
@@ -420,36 +471,18 @@ class PokemonTracker:
         """Generate cache key based on current region/mode/filter state."""
         return f"{self.current_region.display_name}_{self.current_mode.value}_{self.view_filter.value}"
     
-    def _get_data_hash(self) -> str:
-        """Generate hash of current pokemon data to detect changes."""
-        data_str = ""
-        for pokemon in self.pokemon_list:
-            data_str += f"{pokemon.id}{pokemon.captured_normal}{pokemon.captured_shiny}"
-        return hashlib.md5(data_str.encode()).hexdigest()
-    
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached UI state exists and data hasn't changed."""
         if cache_key not in self._region_cache:
             return False
-        
-        current_hash = self._get_data_hash()
-        cached_hash = self._region_cache[cache_key].get('data_hash')
-        return current_hash == cached_hash
+        return self._region_cache[cache_key].get('data_version') == self._data_version
     
     def _save_ui_state_to_cache(self, cache_key: str) -> None:
-        """Save current UI state to cache."""
-        try:
-            filtered_pokemon = self._get_filtered_pokemon()
-            cache_data = {
-                'data_hash': self._get_data_hash(),
-                'total_pages': self.total_pages,
-                'filtered_count': len(filtered_pokemon),
-                'pokemon_ids': [p.display_id for p in filtered_pokemon],
-                'timestamp': time.time()
-            }
-            self._region_cache[cache_key] = cache_data
-        except Exception as e:
-            print(f"Failed to save UI state to cache: {e}")
+        """Save current UI state to cache (only what _restore_from_cache_fast and _is_cache_valid read)."""
+        self._region_cache[cache_key] = {
+            'data_version': self._data_version,
+            'total_pages': self.total_pages,
+        }
     
     def _should_use_cache(self) -> bool:
         """Determine if we should use cached UI state."""
@@ -461,30 +494,10 @@ class PokemonTracker:
         try:
             cache_data = self._region_cache[cache_key]
             
-            # Clear existing widgets
-            for widget in self.main_scrollable.winfo_children():
-                widget.destroy()
-            self.card_widgets.clear()
-            
             # Restore pagination state from cache
             self.total_pages = cache_data['total_pages']
-            self.current_page = min(self.current_page, self.total_pages - 1)
-            self.current_page = max(0, self.current_page)
-            
-            # Create cards for current page
-            current_pokemon = self._get_current_page_pokemon()
-            for row, pokemon in enumerate(current_pokemon):
-                self.card_widgets.append(self._create_pokemon_card_fast(pokemon, row))
-            
-            # Reset scroll position
-            self.root.after(10, self._reset_scroll_position)
-            
-            # Update UI elements
-            self._update_pagination_controls()
-            self._update_progress()
-            
-            # Load sprites with lower priority (cached sprites load instantly anyway)
-            self.root.after(100, self._load_sprites_deferred)
+            self._clamp_page()
+            self._populate_current_page()
             
         except Exception as e:
             print(f"Failed to restore from cache, falling back to regular load: {e}")
@@ -495,91 +508,188 @@ class PokemonTracker:
     
     def _invalidate_cache(self) -> None:
         """Invalidate all cached UI states when data changes."""
+        self._data_version += 1
         self._region_cache.clear()
+        self._filtered_views.clear()
     
-    def _create_cards_progressively(self, pokemon_list: List[Pokemon]) -> None:
-        """Create Pokemon cards progressively to avoid UI blocking."""
-        self._progressive_index = 0
-        self._progressive_pokemon_list = pokemon_list
-        self._create_card_batch()
+    # ---- Card pool ----
+    def _create_card_pool(self) -> None:
+        """Reserve ITEMS_PER_PAGE card slots; pages reconfigure cards instead of rebuilding them."""
+        self._card_pool = [None] * ITEMS_PER_PAGE
+        
+        # One persistent status row (loading / empty view) below the pool rows
+        self._status_frame = ctk.CTkFrame(self.main_scrollable)
+        self._status_label = ctk.CTkLabel(self._status_frame, text="", font=self._font_cache['loading_font'])
+        self._status_label.pack(pady=20)
+        self._status_frame.grid(row=ITEMS_PER_PAGE, column=0, sticky="ew", padx=20, pady=50)
+        self._status_frame.grid_remove()
     
-    def _create_card_batch(self) -> None:
-        """Create a batch of cards (5-10 at a time) to keep UI responsive."""
-        batch_size = 8  # Create 8 cards per batch
-        end_index = min(self._progressive_index + batch_size, len(self._progressive_pokemon_list))
+    def _show_status(self, text: str) -> None:
+        """Show the status row with the given message."""
+        self._status_label.configure(text=text)
+        self._status_frame.grid()
+    
+    def _build_card(self, row: int) -> CardWidgets:
+        """Build the card for one pool row (left gridded; the caller fills it in)."""
+        card_frame = ctk.CTkFrame(
+            self.main_scrollable, 
+            height=CARD_HEIGHT, 
+            corner_radius=6
+        )
+        card_frame.grid(row=row, column=0, sticky="ew", padx=8, pady=3)
+        card_frame.grid_propagate(False)
+        card_frame.grid_columnconfigure(2, weight=1)
         
-        # Create batch of cards
-        for i in range(self._progressive_index, end_index):
-            row = i
-            pokemon = self._progressive_pokemon_list[i]
-            self.card_widgets.append(self._create_pokemon_card_optimized(pokemon, row))
+        id_label = ctk.CTkLabel(card_frame, text="", font=self._font_cache['id_font'], width=80)
+        id_label.grid(row=0, column=0, padx=12, pady=20)
         
-        self._progressive_index = end_index
+        sprite_label = ctk.CTkLabel(
+            card_frame, 
+            image=self.sprite_manager.placeholder, 
+            text="", 
+            width=80
+        )
+        sprite_label.grid(row=0, column=1, padx=8, pady=10)
+        
+        name_label = ctk.CTkLabel(
+            card_frame, 
+            text="", 
+            font=self._font_cache['name_font_normal'], 
+            anchor="w"
+        )
+        name_label.grid(row=0, column=2, sticky="ew", padx=12, pady=20)
+        
+        var = ctk.BooleanVar(value=False)
+        checkbox = ctk.CTkCheckBox(
+            card_frame, 
+            text="Captured", 
+            variable=var,
+            font=self._font_cache['checkbox_font']
+        )
+        checkbox.grid(row=0, column=3, padx=12, pady=20)
         
-        # Schedule next batch if more cards to create
-        if self._progressive_index < len(self._progressive_pokemon_list):
-            self.root.after(1, self._create_card_batch)  # Very short delay
+        card = CardWidgets(card_frame, id_label, sprite_label, name_label, checkbox, var, visible=True)
+        checkbox.configure(command=lambda: self._toggle_capture(card))
+        return card
+    
+    def _populate_card_pool(self, pokemon_list: List[Pokemon]) -> None:
+        """Show pokemon_list in the pooled cards and hide the unused ones."""
+        # Forget label bindings from the previous page so in-flight loads can't land on reused labels
+        self.sprite_manager.cancel_pending_loads()
+        self.card_widgets.clear()
+        placeholder = self.sprite_manager.placeholder
+        shiny = self.current_mode is Mode.SHINY
+        
+        pool = self._card_pool
+        for i, pokemon in enumerate(pokemon_list):
+            card = pool[i]
+            if card is None:
+                card = pool[i] = self._build_card(i)
+            is_captured = pokemon.captured_shiny if shiny else pokemon.captured_normal
+            card.pokemon = pokemon
+            color = _CARD_COLORS[is_captured, pokemon.is_variant]
+            if color != card.color:
+                card.frame.configure(fg_color=color)
+                card.color = color
+            card.id_label.configure(text=pokemon.hash_id)
+            card.sprite_label.configure(image=placeholder)
+            card.name_label.configure(
+                text=pokemon.display_name,
+                font=self._font_cache['name_font_bold'] if pokemon.is_variant else self._font_cache['name_font_normal']
+            )
+            card.var.set(is_captured)
+            if not card.visible:
+                card.frame.grid()
+                card.visible = True
+            self.card_widgets.append((pokemon, card.sprite_label, card.frame))
+        
+        for card in pool[len(pokemon_list):]:
+            if card is not None:
+                card.pokemon = None
+                if card.visible:
+                    card.frame.grid_remove()
+                    card.visible = False
+        
+        if pokemon_list:
+            self._status_frame.grid_remove()
         else:
-            # All cards created, now update UI and load sprites
-            self._update_pagination_controls()
-            self._update_progress()
-            self.root.after(50, self._load_sprites_deferred)
-            
-            # Save to cache
-            cache_key = self._get_cache_key()
-            self._save_ui_state_to_cache(cache_key)
+            self._show_status("No Pokémon match this filter")
 
     def _update_visible_sprites(self) -> None:
         """Prioritize loading sprites that are actually in view."""
-        if not self.card_widgets:
+        if not self.card_widgets or self._canvas is None:
             return
 
-        visible_keys = []
+        # Cards are equal-height grid rows, so one yview() call maps straight to row indices
         try:
-            viewport_top = self.main_scrollable.winfo_rooty()
-            viewport_bottom = viewport_top + self.main_scrollable.winfo_height()
-        except:
+            top_frac, bottom_frac = self._canvas.yview()
+        except Exception:
             return
 
-        for pokemon, sprite_label, _ in self.card_widgets:
-            try:
-                if sprite_label.winfo_exists():
-                    y = sprite_label.winfo_rooty()
-                    # Small buffer so near-edge rows get prioritized too
-                    if (viewport_top - 100) <= y <= (viewport_bottom + 100):
-                        sprite_key = self.sprite_manager.get_sprite_key(pokemon, self.current_mode)
-                        visible_keys.append(sprite_key)
-            except:
-                pass
+        n = len(self.card_widgets)
+        # Two-row buffer so near-edge rows get prioritized too
+        first = max(0, int(top_frac * n) - 2)
+        last = min(n, int(bottom_frac * n) + 2)
+        mode = self.current_mode
+        get_key = self.sprite_manager.get_sprite_key
+        visible_keys = [get_key(pokemon, mode) for pokemon, _, _ in self.card_widgets[first:last]]
 
         self.sprite_manager.mark_visible(visible_keys)
 
     # ---- Filtering helpers ----
-    def _region_filter(self, p: Pokemon) -> bool:
-        """Check if Pokemon belongs to current region."""
-        return self.current_region.start <= p.id <= self.current_region.end
-
-    def _status_filter(self, p: Pokemon) -> bool:
-        """Check if Pokemon matches current view filter."""
-        if self.view_filter == ViewFilter.ALL:
-            return True
-        captured = p.is_captured(self.current_mode)
-        if self.view_filter == ViewFilter.CAPTURED:
-            return captured
-        if self.view_filter == ViewFilter.MISSING:
-            return not captured
-        return True
+    def _get_region_pokemon(self) -> List[Pokemon]:
+        """Get all Pokemon in the current region (shared list; callers must not mutate)."""
+        return self._region_members[self.current_region]
 
     def _get_filtered_pokemon(self) -> List[Pokemon]:
-        """Get Pokemon list filtered by region and status."""
-        return [p for p in self.pokemon_list if self._region_filter(p) and self._status_filter(p)]
+        """Get Pokemon list filtered by region and status (memoized; callers must not mutate)."""
+        key = (self.current_region, self.current_mode, self.view_filter)
+        filtered = self._filtered_views.get(key)
+        if filtered is not None:
+            return filtered
+        
+        regional = self._get_region_pokemon()
+        vf = self.view_filter
+        if vf is ViewFilter.ALL:
+            filtered = regional
+        elif self.current_mode is Mode.SHINY:
+            if vf is ViewFilter.CAPTURED:
+                filtered = [p for p in regional if p.captured_shiny]
+            else:
+                filtered = [p for p in regional if not p.captured_shiny]
+        elif vf is ViewFilter.CAPTURED:
+            filtered = [p for p in regional if p.captured_normal]
+        else:
+            filtered = [p for p in regional if not p.captured_normal]
+        self._filtered_views[key] = filtered
+        return filtered
+    
+    def _clamp_page(self) -> None:
+        """Keep current_page within [0, total_pages - 1] in a single assignment."""
+        last_page = self.total_pages - 1
+        page = self.current_page
+        self.current_page = 0 if page <= 0 or last_page <= 0 else min(page, last_page)
     
     def _get_current_page_pokemon(self) -> List[Pokemon]:
-        """Get Pokemon for the current page."""
-        filtered = self._get_filtered_pokemon()
+        """Get Pokemon for the current page without building a filtered list just for it."""
         start_idx = self.current_page * ITEMS_PER_PAGE
         end_idx = start_idx + ITEMS_PER_PAGE
-        return filtered[start_idx:end_idx]
+        vf = self.view_filter
+        if vf is ViewFilter.ALL:
+            return self._get_region_pokemon()[start_idx:end_idx]
+        
+        filtered = self._filtered_views.get((self.current_region, self.current_mode, vf))
+        if filtered is not None:
+            return filtered[start_idx:end_idx]
+        
+        # No memo for this view: scan lazily and stop once the page is filled
+        want = vf is ViewFilter.CAPTURED
+        shiny = self.current_mode is Mode.SHINY
+        matches = (
+            p for p in self._get_region_pokemon()
+            if bool(p.captured_shiny if shiny else p.captured_normal) is want
+        )
+        return list(islice(matches, start_idx, end_idx))
     
     def _update_display(self) -> None:
         """Update the main display with current Pokemon - optimized with caching."""
@@ -595,6 +705,12 @@ class PokemonTracker:
         self._loading = True
         self.sprite_manager.cancel_pending_loads()
         
+        # Once any pool card exists, pages are only reconfigured - too quick to warrant the loading flash.
+        # The first paint builds the cards, so it shows the loading state and defers the build.
+        if any(self._card_pool):
+            self._update_display_deferred()
+            return
+        
         # Show loading state immediately
         self._show_loading_state()
         
@@ -603,20 +719,14 @@ class PokemonTracker:
     
     def _show_loading_state(self) -> None:
         """Show loading indicator during region switches."""
-        # Clear existing widgets efficiently
-        for widget in self.main_scrollable.winfo_children():
-            widget.destroy()
+        # Hide pooled cards; they are reconfigured once the new page is ready
+        for card in self._card_pool:
+            if card is not None and card.visible:
+                card.frame.grid_remove()
+                card.visible = False
         self.card_widgets.clear()
         
-        # Show loading message
-        loading_frame = ctk.CTkFrame(self.main_scrollable)
-        loading_frame.pack(fill="both", expand=True, padx=20, pady=50)
-        
-        ctk.CTkLabel(
-            loading_frame,
-            text="🔄 Loading Pokémon...",
-            font=ctk.CTkFont(size=18, weight="bold")
-        ).pack(pady=20)
+        self._show_status("🔄 Loading Pokémon...")
         
         # Update pagination immediately with placeholder
         self.page_info_label.configure(text="Loading...")
@@ -626,27 +736,33 @@ class PokemonTracker:
     def _update_display_deferred(self) -> None:
         """Deferred display update that happens after loading state is shown."""
         try:
-            # Clear loading state
-            for widget in self.main_scrollable.winfo_children():
-                widget.destroy()
-            self.card_widgets.clear()
-            
             # Calculate pagination
             filtered_pokemon = self._get_filtered_pokemon()
             self.total_pages = max(1, (len(filtered_pokemon) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
-            self.current_page = min(self.current_page, self.total_pages - 1)
-            self.current_page = max(0, self.current_page)
+            self._clamp_page()
+            self._populate_current_page()
             
-            # Create cards progressively to avoid UI blocking
-            current_pokemon = self._get_current_page_pokemon()
-            self._create_cards_progressively(current_pokemon)
-            
-            # Reset scroll position to top so user can see the new content
-            self.root.after(10, self._reset_scroll_position)
+            # Save to cache
+            cache_key = self._get_cache_key()
+            self._save_ui_state_to_cache(cache_key)
             
         finally:
             self._loading = False
     
+    def _populate_current_page(self) -> None:
+        """Show the current page in the pooled cards (total_pages must already be up to date)."""
+        # Reconfigure pooled cards in place - no widget creation or destruction
+        self._populate_card_pool(self._get_current_page_pokemon())
+        
+        # Reset scroll position to top so user can see the new content
+        self.root.after(10, self._reset_scroll_position)
+        
+        self._update_pagination_controls()
+        self._update_progress()
+        
+        # Queue sprites right away (cached sprites load instantly anyway)
+        self._load_sprites_deferred()
+    
     def _load_sprites_deferred(self) -> None:
         """Load sprites after the UI is already showing - prevents blocking."""
         # Use batch loading for better performance
@@ -666,235 +782,96 @@ class PokemonTracker:
     def _update_progress(self) -> None:
         """Update progress display."""
         # Progress shown against the current REGION (ignoring filter), as that's more intuitive
-        regional = [p for p in self.pokemon_list if self._region_filter(p)]
-        captured = sum(1 for p in regional if p.is_captured(self.current_mode))
+        regional = self._get_region_pokemon()
+        key = (self.current_region, self.current_mode, self._data_version)
+        if key != self._progress_cache_key:
+            if self.current_mode is Mode.SHINY:
+                self._progress_cache_value = sum(1 for p in regional if p.captured_shiny)
+            else:
+                self._progress_cache_value = sum(1 for p in regional if p.captured_normal)
+            self._progress_cache_key = key
+        captured = self._progress_cache_value
         total = len(regional)
         filter_text = f" | Filter: {self.view_filter.value}"
         self.progress_label.configure(
             text=f"{self.current_mode.value} Progress: {captured}/{total} (Page {self.current_page + 1}/{self.total_pages}){filter_text}"
         )
 
-    def _create_pokemon_card(self, pokemon: Pokemon, row: int) -> Tuple:
-        """Create a Pokemon card widget."""
-        is_captured = pokemon.is_captured(self.current_mode)
-        if is_captured:
-            card_color = COLORS["captured"]
-        elif pokemon.is_variant:
-            card_color = COLORS["variant"]
-        else:
-            card_color = None
-        
-        card_frame = ctk.CTkFrame(
-            self.main_scrollable, 
-            height=CARD_HEIGHT, 
-            corner_radius=10, 
-            fg_color=card_color
-        )
-        card_frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
-        card_frame.grid_propagate(False)
-        card_frame.grid_columnconfigure(2, weight=1)
-        
-        # Pokemon ID
-        ctk.CTkLabel(
-            card_frame, 
-            text=f"#{pokemon.display_id}", 
-            font=ctk.CTkFont(size=14, weight="bold"), 
-            width=80
-        ).grid(row=0, column=0, padx=15, pady=25)
-        
-        # Sprite
-        sprite_label = ctk.CTkLabel(
-            card_frame, 
-            image=self.sprite_manager.placeholder, 
-            text="", 
-            width=80
-        )
-        sprite_label.grid(row=0, column=1, padx=10, pady=13)
-        self.sprite_manager.queue_sprite_load(pokemon, sprite_label, self.current_mode)
-        
-        # Pokemon name
-        ctk.CTkLabel(
-            card_frame,
-            text=pokemon.get_display_name(),
-            font=ctk.CTkFont(size=16, weight="bold" if pokemon.is_variant else "normal"),
-            anchor="w"
-        ).grid(row=0, column=2, sticky="ew", padx=15, pady=25)
-        
-        # Capture checkbox
-        var = ctk.BooleanVar(value=is_captured)
-        ctk.CTkCheckBox(
-            card_frame, 
-            text="Captured", 
-            variable=var,
-            command=lambda: self._toggle_capture(pokemon, var),
-            font=ctk.CTkFont(size=12)
-        ).grid(row=0, column=3, padx=15, pady=25)
-        
-        return (pokemon, sprite_label, card_frame)
+    # ---- Persistence ----
+    def _schedule_save(self) -> None:
+        """Save 500ms after the last change so bursts of toggles cost one write."""
+        if self._save_pending:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(500, self._flush_save)
     
-    def _create_pokemon_card_fast(self, pokemon: Pokemon, row: int) -> Tuple:
-        """Create a Pokemon card widget optimized for fast loading (no immediate sprites)."""
-        is_captured = pokemon.is_captured(self.current_mode)
-        if is_captured:
-            card_color = COLORS["captured"]
-        elif pokemon.is_variant:
-            card_color = COLORS["variant"]
-        else:
-            card_color = None
-        
-        card_frame = ctk.CTkFrame(
-            self.main_scrollable, 
-            height=CARD_HEIGHT, 
-            corner_radius=10, 
-            fg_color=card_color
-        )
-        card_frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
-        card_frame.grid_propagate(False)
-        card_frame.grid_columnconfigure(2, weight=1)
-        
-        # Pokemon ID
-        ctk.CTkLabel(
-            card_frame, 
-            text=f"#{pokemon.display_id}", 
-            font=ctk.CTkFont(size=14, weight="bold"), 
-            width=80
-        ).grid(row=0, column=0, padx=15, pady=25)
-        
-        # Sprite placeholder (no immediate loading)
-        sprite_label = ctk.CTkLabel(
-            card_frame, 
-            image=self.sprite_manager.placeholder, 
-            text="", 
-            width=80
-        )
-        sprite_label.grid(row=0, column=1, padx=10, pady=13)
-        # Note: No sprite loading here - will be done later in batch
-        
-        # Pokemon name
-        ctk.CTkLabel(
-            card_frame,
-            text=pokemon.get_display_name(),
-            font=ctk.CTkFont(size=16, weight="bold" if pokemon.is_variant else "normal"),
-            anchor="w"
-        ).grid(row=0, column=2, sticky="ew", padx=15, pady=25)
-        
-        # Capture checkbox
-        var = ctk.BooleanVar(value=is_captured)
-        ctk.CTkCheckBox(
-            card_frame, 
-            text="Captured", 
-            variable=var,
-            command=lambda: self._toggle_capture(pokemon, var),
-            font=ctk.CTkFont(size=12)
-        ).grid(row=0, column=3, padx=15, pady=25)
-        
-        return (pokemon, sprite_label, card_frame)
-    
-    def _create_pokemon_card_optimized(self, pokemon: Pokemon, row: int) -> Tuple:
-        """Create a Pokemon card widget with maximum performance optimizations."""
-        is_captured = pokemon.is_captured(self.current_mode)
-        
-        # Pre-determine colors without creating variables
-        card_color = (COLORS["captured"] if is_captured else 
-                     COLORS["variant"] if pokemon.is_variant else None)
-        
-        # Create frame with minimal configuration
-        card_frame = ctk.CTkFrame(
-            self.main_scrollable, 
-            height=CARD_HEIGHT, 
-            corner_radius=6,  # Slightly smaller radius for faster rendering
-            fg_color=card_color
-        )
-        card_frame.grid(row=row, column=0, sticky="ew", padx=8, pady=3)  # Reduced padding
-        card_frame.grid_propagate(False)
-        card_frame.grid_columnconfigure(2, weight=1)
-        
-        # Pokemon ID - use cached font
-        id_label = ctk.CTkLabel(
-            card_frame, 
-            text=f"#{pokemon.display_id}", 
-            font=self._font_cache['id_font'],
-            width=80
-        )
-        id_label.grid(row=0, column=0, padx=12, pady=20)
-        
-        # Sprite placeholder - minimal configuration
-        sprite_label = ctk.CTkLabel(
-            card_frame, 
-            image=self.sprite_manager.placeholder, 
-            text="", 
-            width=80
-        )
-        sprite_label.grid(row=0, column=1, padx=8, pady=10)
-        
-        # Pokemon name - use cached font
-        name_label = ctk.CTkLabel(
-            card_frame,
-            text=pokemon.get_display_name(),
-            font=self._font_cache['name_font_bold'] if pokemon.is_variant else self._font_cache['name_font_normal'],
-            anchor="w"
-        )
-        name_label.grid(row=0, column=2, sticky="ew", padx=12, pady=20)
-        
-        # Capture checkbox - use cached font
-        var = ctk.BooleanVar(value=is_captured)
-        checkbox = ctk.CTkCheckBox(
-            card_frame, 
-            text="Captured", 
-            variable=var,
-            command=lambda: self._toggle_capture(pokemon, var),
-            font=self._font_cache['checkbox_font']
-        )
-        checkbox.grid(row=0, column=3, padx=12, pady=20)
-        
-        return (pokemon, sprite_label, card_frame)
+    def _flush_save(self) -> None:
+        """Queue a write of the current capture data, cancelling any scheduled save."""
+        if self._save_pending:
+            self.root.after_cancel(self._save_pending)
+            self._save_pending = None
+        DataManager.save_async(self.pokemon_list)
 
     # ---- Event handlers ----
-    def _toggle_capture(self, pokemon: Pokemon, var: ctk.BooleanVar) -> None:
-        """Toggle Pokemon capture status."""
-        pokemon.set_captured(self.current_mode, var.get())
-        DataManager.save(self.pokemon_list)
-        
-        # Invalidate cache since data changed
+    def _toggle_capture(self, card: CardWidgets) -> None:
+        """Toggle the capture status of the Pokemon shown on card."""
+        pokemon = card.pokemon
+        is_captured = card.var.get()
+        pokemon.set_captured(self.current_mode, is_captured)
+        self._schedule_save()
+        
+        # Only this card's color can have changed
+        color = _CARD_COLORS[is_captured, pokemon.is_variant]
+        if color != card.color:
+            card.frame.configure(fg_color=color)
+            card.color = color
+        
+        # Invalidate right away (cheap) so no render can reuse stale views; repaint progress once per burst
         self._invalidate_cache()
-        
+        if self._refresh_pending:
+            self.root.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.root.after(50, self._do_refresh)
+    
+    def _do_refresh(self) -> None:
+        """Repaint progress after capture changes."""
+        if self._refresh_pending:
+            self.root.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
         self._update_progress()
-        self._refresh_card_colors()
 
-    def _refresh_card_colors(self) -> None:
-        """Refresh card colors based on capture status."""
-        for pokemon, _, card_frame in self.card_widgets:
-            is_captured = pokemon.is_captured(self.current_mode)
-            if is_captured:
-                color = COLORS["captured"]
-            elif pokemon.is_variant:
-                color = COLORS["variant"]
-            else:
-                color = COLORS["card_default"]
-            try:
-                card_frame.configure(fg_color=color)
-            except:
-                pass
+    def _refresh_card_states(self) -> None:
+        """Sync the shown cards' checkboxes and colors with capture status, reconfiguring only what changed."""
+        shiny = self.current_mode is Mode.SHINY
+        for card in self._card_pool:
+            if card is None or card.pokemon is None:
+                continue
+            pokemon = card.pokemon
+            is_captured = pokemon.captured_shiny if shiny else pokemon.captured_normal
+            if card.var.get() != is_captured:
+                card.var.set(is_captured)
+            color = _CARD_COLORS[is_captured, pokemon.is_variant]
+            if color != card.color and card.frame.winfo_exists():
+                card.frame.configure(fg_color=color)
+                card.color = color
 
     def _on_mode_change(self, mode_str: str) -> None:
         """Handle mode change with optimized performance."""
-        self.current_mode = Mode(mode_str)
+        mode = Mode(mode_str)
+        if mode is self.current_mode:
+            return  # Re-click of the already selected segment
+        self.current_mode = mode
         self.title_label.configure(
             text="✨ Pokémon Home Shiny Pokédex Tracker ✨" if self.current_mode == Mode.SHINY 
             else "Pokémon Home Pokédex Tracker"
         )
         self.current_page = 0
-        
-        # Clear sprite cache when switching modes to avoid wrong sprite types
-        self.sprite_manager.clear_cache()
         self._update_display()
 
     def _on_filter_change(self, filter_str: str) -> None:
         """Handle view filter change."""
-        for vf in ViewFilter:
-            if vf.value == filter_str:
-                self.view_filter = vf
-                break
+        view_filter = FILTER_BY_VALUE.get(filter_str, self.view_filter)
+        if view_filter is self.view_filter:
+            return
+        self.view_filter = view_filter
         self.current_page = 0
         self._update_display()
     
@@ -911,36 +888,44 @@ class PokemonTracker:
         """Actually execute the region change."""
         self._region_switch_pending = None
         
-        for region in Region:
-            if region.display_name == region_str:
-                self.current_region = region
-                break
+        region = REGION_BY_NAME.get(region_str, self.current_region)
+        if region is self.current_region:
+            return
+        self.current_region = region
         
         self.current_page = 0
-        if self.current_region == Region.NATIONAL:
-            self.sprite_manager.clear_cache()
-        
         self._update_display()
     
+    def _turn_page(self) -> None:
+        """Show another page of the same view; only a data change forces a full update."""
+        if self._is_cache_valid(self._get_cache_key()):
+            self._populate_current_page()  # total_pages is still correct for this view
+        else:
+            self._update_display()
+    
     def _prev_page(self) -> None:
         """Go to previous page."""
-        if self.current_page > 0:
+        if self.current_page > 0 and not self._loading:
             self.current_page -= 1
-            self._update_display()
+            self._turn_page()
     
     def _next_page(self) -> None:
         """Go to next page."""
-        if self.current_page < self.total_pages - 1:
+        if self.current_page < self.total_pages - 1 and not self._loading:
             self.current_page += 1
-            self._update_display()
+            self._turn_page()
     
     def _jump_to_page(self) -> None:
         """Jump to specific page."""
         try:
             page_num = int(self.page_entry.get()) - 1
+            if page_num == self.current_page:
+                # Already showing it: clear the entry like a real page turn would, but skip the rebuild
+                self.page_entry.delete(0, 'end')
+                return
             if 0 <= page_num < self.total_pages:
                 self.current_page = page_num
-                self._update_display()
+                self._turn_page()
             else:
                 messagebox.showwarning(
                     "Invalid Page", 
@@ -949,85 +934,95 @@ class PokemonTracker:
         except ValueError:
             messagebox.showwarning("Invalid Input", "Please enter a valid page number")
     
-    def _check_all_page(self) -> None:
-        """Mark all Pokemon on current page as captured."""
+    def _bulk_set_page(self, captured: bool) -> None:
+        """Mark every Pokemon on the current page as captured or not captured."""
         mode_text = self.current_mode.value.lower()
-        if messagebox.askyesno("Confirm", f"Mark all {mode_text} Pokémon on THIS PAGE as captured?"):
-            for pokemon in self._get_current_page_pokemon():
-                pokemon.set_captured(self.current_mode, True)
-            DataManager.save(self.pokemon_list)
-            self._invalidate_cache()
-            self._update_display()
+        state = "captured" if captured else "NOT captured"
+        if messagebox.askyesno("Confirm", f"Mark all {mode_text} Pokémon on THIS PAGE as {state}?"):
+            self._bulk_set(self._get_current_page_pokemon(), captured)
 
-    def _uncheck_all_page(self) -> None:
-        """Mark all Pokemon on current page as not captured."""
-        mode_text = self.current_mode.value.lower()
-        if messagebox.askyesno("Confirm", f"Mark all {mode_text} Pokémon on THIS PAGE as NOT captured?"):
-            for pokemon in self._get_current_page_pokemon():
-                pokemon.set_captured(self.current_mode, False)
-            DataManager.save(self.pokemon_list)
-            self._invalidate_cache()
-            self._update_display()
-
-    def _check_all_region(self) -> None:
-        """Mark all Pokemon in current region as captured."""
+    def _bulk_set_region(self, captured: bool) -> None:
+        """Mark every Pokemon in the current region as captured or not captured."""
         mode_text = self.current_mode.value.lower()
         region_name = self.current_region.display_name
-        if messagebox.askyesno("Confirm", f"Mark ALL {mode_text} Pokémon in {region_name} as captured?"):
-            for p in self.pokemon_list:
-                if self._region_filter(p):
-                    p.set_captured(self.current_mode, True)
-            DataManager.save(self.pokemon_list)
-            self._invalidate_cache()
-            self._update_display()
+        state = "captured" if captured else "NOT captured"
+        if messagebox.askyesno("Confirm", f"Mark ALL {mode_text} Pokémon in {region_name} as {state}?"):
+            self._bulk_set(self._get_region_pokemon(), captured)
 
-    def _uncheck_all_region(self) -> None:
-        """Mark all Pokemon in current region as not captured."""
-        mode_text = self.current_mode.value.lower()
-        region_name = self.current_region.display_name
-        if messagebox.askyesno("Confirm", f"Mark ALL {mode_text} Pokémon in {region_name} as NOT captured?"):
-            for p in self.pokemon_list:
-                if self._region_filter(p):
-                    p.set_captured(self.current_mode, False)
-            DataManager.save(self.pokemon_list)
-            self._invalidate_cache()
+    def _bulk_set(self, pokemon_list: List[Pokemon], captured: bool) -> None:
+        """Apply one capture state to many Pokemon, then save and repaint once."""
+        mode = self.current_mode
+        for pokemon in pokemon_list:
+            pokemon.set_captured(mode, captured)
+        self._flush_save()
+        self._invalidate_cache()
+        if self.view_filter is ViewFilter.ALL:
+            # Same Pokemon on the same page; only checkboxes, colors and the count change
+            self._refresh_card_states()
+            self._update_progress()
+        else:
             self._update_display()
     
     def _download_csv(self) -> None:
         """Export Pokemon data to CSV with intuitive dialog."""
+        if self._export_in_flight:
+            return  # One export at a time; the running one reports when it finishes
+        
         def handle_export_choice(choice: str) -> None:
             if choice == "cancel":
                 return  # User cancelled, do nothing
             
             elif choice == "region":
                 # Export current region only
-                selected = [p for p in self.pokemon_list if self._region_filter(p)]
+                selected = self._get_region_pokemon()
                 export_region = self.current_region
                 
             elif choice == "national":
                 # Export complete National Dex
-                selected = self.pokemon_list.copy()  # All Pokemon
+                selected = self._region_members[Region.NATIONAL]  # All Pokemon
                 export_region = Region.NATIONAL
             
             else:
                 return  # Unknown choice, do nothing
             
-            # Perform the export
-            success = DataManager.export_csv(self.root, selected, export_region, self.current_mode)
+            mode = self.current_mode
+            filepath = DataManager.ask_csv_path(self.root, export_region, mode)
+            if not filepath:
+                return
             
-            if success:
-                # Show success message with details
-                count = len(selected)
-                scope = "National Dex" if choice == "national" else f"{export_region.display_name} region"
-                mode = self.current_mode.value
-                
-                messagebox.showinfo(
-                    "Export Successful! 🎉",
-                    f"Successfully exported {count} Pokémon from {scope}\n"
-                    f"Mode: {mode}\n"
-                    f"Captured: {sum(1 for p in selected if p.is_captured(self.current_mode))}\n"
-                    f"Missing: {sum(1 for p in selected if not p.is_captured(self.current_mode))}"
-                )
+            # Snapshot on the UI thread; the file and the summary both come from these rows
+            rows = DataManager.csv_rows(selected, mode)
+            count = len(rows)
+            captured = sum(1 for row in rows if row[4] == 'Yes')
+            scope = "National Dex" if choice == "national" else f"{export_region.display_name} region"
+            
+            def finish(show: Callable[[], None]) -> None:
+                self._export_in_flight = False
+                show()
+            
+            def do_export() -> None:
+                # Runs on a worker thread: only touch Tk through root.after
+                try:
+                    DataManager.write_csv(filepath, rows)
+                except Exception as e:
+                    reason = str(e)
+                    show = lambda: messagebox.showerror("Error", f"Failed to save CSV:\n{reason}")
+                else:
+                    show = lambda: messagebox.showinfo(
+                        "Export Successful! 🎉",
+                        f"Successfully exported {count} Pokémon from {scope}\n"
+                        f"Mode: {mode.value}\n"
+                        f"Captured: {captured}\n"
+                        f"Missing: {count - captured}\n\n"
+                        f"Saved as:\n{filepath}"
+                    )
+                try:
+                    self.root.after(0, lambda: finish(show))
+                except Exception:
+                    pass  # Window already closed
+            
+            self._export_in_flight = True
+            threading.Thread(target=do_export, daemon=True).start()
         
         # Show the improved export dialog
         CSVExportDialog(
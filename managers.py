@@ -3,45 +3,145 @@
 import csv
 import json
 import os
+import queue
+import sqlite3
 import threading
 import time
-from collections import deque
-from dataclasses import asdict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from tkinter import filedialog, messagebox
-from typing import Dict, List, Set, Tuple
-from urllib.error import URLError
-from urllib.request import urlopen
+from typing import Dict, List, Optional, Set, Tuple
 import io
 
 import customtkinter as ctk
 from PIL import Image
 
 from constants import (
-    SPRITE_SIZE, SPRITE_BASE_URL, DATA_FILE, MAX_CONCURRENT_LOADS, 
-    SPRITE_LOAD_DELAY, API_POKEMON_URL, SPRITE_CACHE_DIR, CACHE_REFRESH_DAYS, CACHE_VERSION
+    SPRITE_SIZE, DATA_FILE, MAX_CONCURRENT_LOADS, MAX_SPRITE_CACHE,
+    API_POKEMON_URL, SPRITE_CACHE_DIR, SPRITE_CACHE_DB, SPRITE_URL_CACHE_FILE,
+    CACHE_REFRESH_DAYS, CACHE_VERSION
 )
 from database import PokemonDatabase
 from models import Pokemon, Mode, Region
 
+# Raw RGBA payload size of one cached sprite
+_RGBA_SPRITE_BYTES = SPRITE_SIZE[0] * SPRITE_SIZE[1] * 4
+
+# Decoded sprites applied to labels per UI drain tick, and the tick interval (ms)
+_DRAIN_BATCH_SIZE = 16
+_DRAIN_INTERVAL_MS = 16
+
+# File buffer for CSV export: rows stream out in a few large writes
+_CSV_BUFFER_SIZE = 1 << 16
+
+# Longest the window waits on close for the data writer thread (seconds)
+_SAVE_WAIT_TIMEOUT = 2.0
+
+
+class SpriteDiskCache:
+    """SQLite-backed sprite store: one database file instead of one PNG per sprite."""
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            # Shared by the sprite worker threads; access is serialized by _lock
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sprites("
+                "key TEXT PRIMARY KEY, blob BLOB NOT NULL, mtime REAL NOT NULL)"
+            )
+            self._conn.commit()
+        except Exception as e:
+            print(f"Failed to open sprite cache database: {e}")
+            self._conn = None
+        self.prune()
+    
+    @staticmethod
+    def _cutoff() -> float:
+        """Oldest mtime still considered fresh."""
+        return time.time() - CACHE_REFRESH_DAYS * 24 * 60 * 60
+    
+    def prune(self) -> None:
+        """Delete expired rows so the database doesn't keep growing with sprites nobody reads."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM sprites WHERE mtime < ?", (self._cutoff(),))
+                self._conn.commit()
+        except Exception as e:
+            print(f"Failed to prune sprite cache: {e}")
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached blob for key if present and not older than CACHE_REFRESH_DAYS."""
+        if self._conn is None:
+            return None
+        cutoff = self._cutoff()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT blob FROM sprites WHERE key = ? AND mtime >= ?", (key, cutoff)
+                ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Failed to read sprite {key} from cache: {e}")
+            return None
+    
+    def put(self, key: str, blob: bytes) -> None:
+        """Insert or replace the blob stored for key."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sprites(key, blob, mtime) VALUES (?, ?, ?)",
+                    (key, sqlite3.Binary(blob), time.time())
+                )
+                self._conn.commit()
+        except Exception as e:
+            print(f"Failed to save sprite {key} to cache: {e}")
+
 
 class LazyLoadSpriteManager:
     """Loads sprites with queueing and supports regional form sprites via PokéAPI."""
     
     def __init__(self, root: ctk.CTk):
         self.root = root
-        self.cache: Dict[str, ctk.CTkImage] = {}
+        self.cache: "OrderedDict[str, ctk.CTkImage]" = OrderedDict()  # LRU, bounded by MAX_SPRITE_CACHE
         self.loading: Set[str] = set()
-        self.load_queue: deque = deque()
+        # Pending loads: visible sprites are dispatched before the bulk backlog
+        self._visible_q: deque = deque()
+        self._bulk_q: deque = deque()
+        self.queued_keys: Set[str] = set()  # Keys in either queue, for O(1) duplicate checks
         self.active_loads = 0
         self._placeholder = None
         self.visible_sprites: Set[str] = set()
         self.sprite_labels: Dict[str, ctk.CTkLabel] = {}
-        self._processing = False
         self.sprite_url_cache: Dict[str, str] = {}
         
+        # Workers download and decode; finished PIL images come back through _results
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LOADS, thread_name_prefix="sprite")
+        self._results: "queue.Queue[Tuple[str, Optional[Image.Image]]]" = queue.Queue()
+        
         # Initialize disk cache
         self._init_disk_cache()
+        
+        # Variant URLs looked up from PokéAPI persist across launches (they never change)
+        self._url_cache_path = os.path.join(SPRITE_CACHE_DIR, SPRITE_URL_CACHE_FILE)
+        self._api_urls: Dict[str, str] = {}
+        self._url_cache_dirty = False
+        # Guards sprite_url_cache, _api_urls and _url_cache_dirty: sprite and prefetch workers write them
+        self._url_lock = threading.Lock()
+        self._url_save_pending = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._load_url_cache()
+        
+        # Timer that hands decoded sprites to Tk in batches; only armed while loads are in flight
+        self._drain_pending = None
     
     @property
     def placeholder(self) -> ctk.CTkImage:
@@ -52,7 +152,8 @@ class LazyLoadSpriteManager:
         return self._placeholder
     
     def _init_disk_cache(self) -> None:
-        """Initialize the disk cache directory."""
+        """Initialize the disk cache directory and sprite database."""
+        self.disk_cache: Optional[SpriteDiskCache] = None
         try:
             os.makedirs(SPRITE_CACHE_DIR, exist_ok=True)
             # Create cache info file if it doesn't exist
@@ -65,46 +166,78 @@ class LazyLoadSpriteManager:
                 }
                 with open(cache_info_path, 'w') as f:
                     json.dump(cache_info, f)
+            db_path = os.path.join(SPRITE_CACHE_DIR, SPRITE_CACHE_DB)
+            first_run = not os.path.exists(db_path)
+            self.disk_cache = SpriteDiskCache(db_path)
+            if first_run:
+                self._remove_legacy_png_cache()
         except Exception as e:
             print(f"Failed to initialize sprite cache: {e}")
     
-    def _get_cache_path(self, sprite_key: str) -> str:
-        """Get the file path for a cached sprite."""
-        # Use PNG format for cached sprites
-        safe_key = sprite_key.replace("/", "_").replace("\\", "_")
-        return os.path.join(SPRITE_CACHE_DIR, f"{safe_key}.png")
+    @staticmethod
+    def _remove_legacy_png_cache() -> None:
+        """Delete the per-sprite PNG files of the pre-SQLite cache (run once, when the database is created)."""
+        removed = 0
+        with os.scandir(SPRITE_CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".png") and entry.is_file():
+                    try:
+                        os.remove(entry.path)
+                        removed += 1
+                    except OSError as e:
+                        print(f"Failed to remove legacy sprite {entry.name}: {e}")
+        if removed:
+            print(f"Removed {removed} legacy sprite cache files")
     
-    def _is_cache_valid(self, cache_path: str) -> bool:
-        """Check if cached sprite exists and is not expired."""
+    def _load_url_cache(self) -> None:
+        """Pre-warm sprite_url_cache with variant URLs resolved in earlier sessions."""
         try:
-            if not os.path.exists(cache_path):
-                return False
-            
-            # Check if file is older than CACHE_REFRESH_DAYS
-            file_time = os.path.getmtime(cache_path)
-            current_time = time.time()
-            days_old = (current_time - file_time) / (24 * 60 * 60)
-            
-            return days_old < CACHE_REFRESH_DAYS
-        except:
-            return False
+            if os.path.exists(self._url_cache_path):
+                with open(self._url_cache_path, 'r', encoding='utf-8') as f:
+                    self._api_urls = json.load(f)
+                self.sprite_url_cache.update(self._api_urls)
+        except Exception as e:
+            print(f"Failed to load sprite URL cache: {e}")
+            self._api_urls = {}
+    
+    def _save_url_cache(self) -> None:
+        """Write resolved variant URLs to disk (UI thread)."""
+        self._url_save_pending = None
+        # Copy under the lock so workers can keep adding URLs while the file is written
+        with self._url_lock:
+            if not self._url_cache_dirty:
+                return
+            self._url_cache_dirty = False
+            snapshot = dict(self._api_urls)
+        try:
+            tmp_path = f"{self._url_cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+            os.replace(tmp_path, self._url_cache_path)
+        except Exception as e:
+            print(f"Failed to save sprite URL cache: {e}")
+            with self._url_lock:
+                self._url_cache_dirty = True  # Try again on the next save
     
     def _save_sprite_to_cache(self, sprite_key: str, image: Image.Image) -> None:
         """Save a sprite image to disk cache."""
+        if self.disk_cache is None:
+            return
         try:
-            cache_path = self._get_cache_path(sprite_key)
-            image.save(cache_path, "PNG")
+            # Store decoded pixels so cache hits skip PNG decoding entirely
+            self.disk_cache.put(sprite_key, image.convert("RGBA").tobytes())
         except Exception as e:
             print(f"Failed to save sprite {sprite_key} to cache: {e}")
     
-    def _load_sprite_from_cache(self, sprite_key: str) -> ctk.CTkImage:
-        """Load a sprite from disk cache."""
+    def _load_sprite_from_cache(self, sprite_key: str) -> Optional[Image.Image]:
+        """Load a decoded sprite from disk cache (worker thread; no Tk objects created)."""
+        if self.disk_cache is None:
+            return None
         try:
-            cache_path = self._get_cache_path(sprite_key)
-            if self._is_cache_valid(cache_path):
-                image = Image.open(cache_path)
-                image = image.resize(SPRITE_SIZE, Image.Resampling.LANCZOS)
-                return ctk.CTkImage(light_image=image, size=SPRITE_SIZE)
+            blob = self.disk_cache.get(sprite_key)
+            # Rows of another size (older PNG entries, changed SPRITE_SIZE) count as misses
+            if blob is not None and len(blob) == _RGBA_SPRITE_BYTES:
+                return Image.frombytes("RGBA", SPRITE_SIZE, blob)
         except Exception as e:
             print(f"Failed to load sprite {sprite_key} from cache: {e}")
         return None
@@ -115,73 +248,120 @@ class LazyLoadSpriteManager:
     
     def _resolve_sprite_url(self, pokemon: Pokemon, mode: Mode) -> str:
         """Resolve the correct sprite URL for a Pokemon and mode."""
-        key = self.get_sprite_key(pokemon, mode)
-        if key in self.sprite_url_cache:
-            return self.sprite_url_cache[key]
-
         if not pokemon.is_variant:
-            url = f"{SPRITE_BASE_URL}/shiny/{pokemon.id}.png" if mode == Mode.SHINY else f"{SPRITE_BASE_URL}/{pokemon.id}.png"
-            self.sprite_url_cache[key] = url
-            return url
+            # Base forms come straight from the precomputed URL table
+            return PokemonDatabase.get_sprite_url(pokemon.id, mode is Mode.SHINY)
 
-        base_slug = PokemonDatabase.get_slug(pokemon.id)
-        if not base_slug:
-            url = f"{SPRITE_BASE_URL}/shiny/{pokemon.id}.png" if mode == Mode.SHINY else f"{SPRITE_BASE_URL}/{pokemon.id}.png"
-            self.sprite_url_cache[key] = url
+        key = self.get_sprite_key(pokemon, mode)
+        with self._url_lock:
+            url = self.sprite_url_cache.get(key)
+        if url is not None:
             return url
 
-        suffix = PokemonDatabase.VARIANT_SUFFIX.get(pokemon.region or "", "").strip()
-        if not suffix:
-            url = f"{SPRITE_BASE_URL}/shiny/{pokemon.id}.png" if mode == Mode.SHINY else f"{SPRITE_BASE_URL}/{pokemon.id}.png"
-            self.sprite_url_cache[key] = url
+        form_slug = self._variant_form_slug(pokemon)
+        if form_slug is None:
+            # No PokéAPI form to ask for; the base sprite stands in
+            url = PokemonDatabase.get_sprite_url(pokemon.id, mode is Mode.SHINY)
+            with self._url_lock:
+                self.sprite_url_cache[key] = url
             return url
 
-        form_slug = f"{base_slug}-{suffix}"
+        self._fetch_variant_urls(pokemon, form_slug)
+        with self._url_lock:
+            return self.sprite_url_cache[key]
+    
+    def _has_url(self, sprite_key: str) -> bool:
+        """Whether a sprite URL is already resolved for sprite_key."""
+        with self._url_lock:
+            return sprite_key in self.sprite_url_cache
+    
+    @staticmethod
+    def _variant_form_slug(pokemon: Pokemon) -> Optional[str]:
+        """PokéAPI form name for a regional variant, or None when it cannot be built."""
+        base_slug = PokemonDatabase.get_slug(pokemon.id)
+        suffix = PokemonDatabase.VARIANT_SUFFIX.get(pokemon.region or "", "").strip()
+        if base_slug and suffix:
+            return f"{base_slug}-{suffix}"
+        return None
+    
+    def _fetch_variant_urls(self, pokemon: Pokemon, form_slug: str) -> None:
+        """Look up a form on PokéAPI once and cache its URLs for both modes."""
+        keys = (self.get_sprite_key(pokemon, Mode.NORMAL), self.get_sprite_key(pokemon, Mode.SHINY))
+        fallbacks = (
+            PokemonDatabase.get_sprite_url(pokemon.id, False),
+            PokemonDatabase.get_sprite_url(pokemon.id, True)
+        )
         try:
             api_url = f"{API_POKEMON_URL}/{form_slug}"
             session = PokemonDatabase.get_session()
             resp = session.get(api_url, timeout=5)
-            resp.raise_for_status()
-            j = resp.json()
-            sprites = j.get("sprites", {}) or {}
-            url = sprites.get("front_shiny" if mode == Mode.SHINY else "front_default")
-            if not url:
-                url = f"{SPRITE_BASE_URL}/shiny/{pokemon.id}.png" if mode == Mode.SHINY else f"{SPRITE_BASE_URL}/{pokemon.id}.png"
+            if 400 <= resp.status_code < 500:
+                # Definitive: the form has no resource of its own (e.g. cosmetic Vivillon patterns)
+                urls = fallbacks
+            else:
+                resp.raise_for_status()
+                j = resp.json()
+                sprites = j.get("sprites", {}) or {}
+                urls = (
+                    sprites.get("front_default") or fallbacks[0],
+                    sprites.get("front_shiny") or fallbacks[1]
+                )
+            persist = True
         except Exception:
-            url = f"{SPRITE_BASE_URL}/shiny/{pokemon.id}.png" if mode == Mode.SHINY else f"{SPRITE_BASE_URL}/{pokemon.id}.png"
-
-        self.sprite_url_cache[key] = url
-        return url
+            # Connection errors, timeouts and 5xx: use the base sprite now, ask again next launch
+            urls = fallbacks
+            persist = False
+        with self._url_lock:
+            self.sprite_url_cache.update(zip(keys, urls))
+            if persist:
+                # Answers from the API, 4xx included, are written to the URL cache file
+                self._api_urls.update(zip(keys, urls))
+                self._url_cache_dirty = True
+    
+    def prefetch_variant_urls(self, pokemon_list: List[Pokemon]) -> None:
+        """Resolve variant URLs missing from the persisted cache in the background.
+        
+        Runs on its own two-thread pool so it never takes slots from visible sprite loads;
+        after the first launch every variant is already cached and nothing is submitted.
+        """
+        pending = []
+        for pokemon in pokemon_list:
+            if not pokemon.is_variant or self._has_url(self.get_sprite_key(pokemon, Mode.NORMAL)):
+                continue
+            form_slug = self._variant_form_slug(pokemon)
+            if form_slug is not None:
+                pending.append((pokemon, form_slug))
+        if not pending:
+            return
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sprite-url")
+        for pokemon, form_slug in pending:
+            self._prefetch_executor.submit(self._fetch_variant_urls, pokemon, form_slug)
     
     def queue_sprite_load(self, pokemon: Pokemon, sprite_label: ctk.CTkLabel, mode: Mode, priority: bool = False):
         """Queue a sprite for loading."""
         sprite_key = self.get_sprite_key(pokemon, mode)
         self.sprite_labels[sprite_key] = sprite_label
         
-        # Check memory cache first
-        if sprite_key in self.cache:
-            sprite_label.configure(image=self.cache[sprite_key])
-            return
-        
-        # Check disk cache second
-        cached_image = self._load_sprite_from_cache(sprite_key)
-        if cached_image:
-            self.cache[sprite_key] = cached_image
-            sprite_label.configure(image=cached_image)
+        # Only the memory cache is checked here; disk reads happen on the workers
+        cached = self.cache.get(sprite_key)
+        if cached is not None:
+            self.cache.move_to_end(sprite_key)
+            sprite_label.configure(image=cached)
             return
         
-        # Only queue for download if not in either cache
-        if sprite_key in self.loading or any(item[0] == sprite_key for item in self.load_queue):
+        if sprite_key in self.loading or sprite_key in self.queued_keys:
             return
         
+        self.queued_keys.add(sprite_key)
         load_item = (sprite_key, pokemon, mode)
         if priority:
-            self.load_queue.appendleft(load_item)
+            self._visible_q.appendleft(load_item)
+        elif sprite_key in self.visible_sprites:
+            self._visible_q.append(load_item)
         else:
-            self.load_queue.append(load_item)
+            self._bulk_q.append(load_item)
         
-        if not self._processing:
-            self._process_queue()
+        self._process_queue()
     
     def mark_visible(self, sprite_keys: List[str]):
         """Mark sprites as visible for prioritization."""
@@ -189,62 +369,91 @@ class LazyLoadSpriteManager:
         self._prioritize_visible()
     
     def _prioritize_visible(self):
-        """Prioritize visible sprites in the load queue."""
-        if not self.load_queue:
+        """Promote queued bulk loads that just became visible."""
+        # Set intersection first: most scroll ticks have nothing new to promote
+        if not self._bulk_q or self.visible_sprites.isdisjoint(self.queued_keys):
             return
-        visible_items, other_items = [], []
-        for item in self.load_queue:
-            if item[0] in self.visible_sprites:
-                visible_items.append(item)
-            else:
-                other_items.append(item)
-        self.load_queue = deque(visible_items + other_items)
+        visible = self.visible_sprites
+        remaining = deque()
+        for item in self._bulk_q:
+            (self._visible_q if item[0] in visible else remaining).append(item)
+        self._bulk_q = remaining
     
     def _process_queue(self):
-        """Process the sprite loading queue."""
-        if not self.load_queue or self.active_loads >= MAX_CONCURRENT_LOADS:
-            return
-        self._processing = True
-        while self.load_queue and self.active_loads < MAX_CONCURRENT_LOADS:
-            sprite_key, pokemon, mode = self.load_queue.popleft()
+        """Fill free worker slots from the load queue (UI thread only).
+        
+        Called when sprites are queued and when _drain_results frees slots, so no
+        polling timer is needed and active_loads is never touched off the UI thread.
+        """
+        while self.active_loads < MAX_CONCURRENT_LOADS:
+            if self._visible_q:
+                sprite_key, pokemon, mode = self._visible_q.popleft()
+            elif self._bulk_q:
+                sprite_key, pokemon, mode = self._bulk_q.popleft()
+            else:
+                break
+            self.queued_keys.discard(sprite_key)
             if sprite_key not in self.loading:
                 self.loading.add(sprite_key)
                 self.active_loads += 1
-                thread = threading.Thread(
-                    target=self._load_sprite_thread,
-                    args=(sprite_key, pokemon, mode),
-                    daemon=True
-                )
-                thread.start()
-        if self.load_queue:
-            self.root.after(100, self._process_queue)
-        else:
-            self._processing = False
+                self._executor.submit(self._load_sprite_thread, sprite_key, pokemon, mode)
+        if self.active_loads and self._drain_pending is None:
+            self._drain_pending = self.root.after(_DRAIN_INTERVAL_MS, self._drain_results)
     
     def _load_sprite_thread(self, sprite_key: str, pokemon: Pokemon, mode: Mode):
-        """Load sprite in background thread."""
+        """Read or download a sprite on a worker thread; the result goes to _results."""
+        image = None
         try:
-            time.sleep(SPRITE_LOAD_DELAY)
+            image = self._load_sprite_from_cache(sprite_key)
+            if image is not None:
+                return
+            
             url = self._resolve_sprite_url(pokemon, mode)
-            with urlopen(url, timeout=5) as response:
-                image_data = response.read()
+            # Shared keep-alive session: TCP/TLS setup is paid once per pooled connection
+            response = PokemonDatabase.get_session().get(url, timeout=5)
+            response.raise_for_status()
+            image_data = response.content
             image = Image.open(io.BytesIO(image_data))
-            image = image.resize(SPRITE_SIZE, Image.Resampling.LANCZOS)
+            # BILINEAR is indistinguishable from LANCZOS at 96px -> 64px and several times cheaper.
+            # resize() rather than thumbnail(): the disk cache relies on exactly SPRITE_SIZE pixels.
+            if image.size != SPRITE_SIZE:
+                image = image.resize(SPRITE_SIZE, Image.Resampling.BILINEAR)
             
             # Save to disk cache for future use
             self._save_sprite_to_cache(sprite_key, image)
-            
-            # Create CustomTkinter image and cache in memory
-            ctk_image = ctk.CTkImage(light_image=image, size=SPRITE_SIZE)
-            self.cache[sprite_key] = ctk_image
-            if sprite_key in self.sprite_labels:
-                self.root.after(0, lambda: self._update_label(sprite_key, ctk_image))
         except Exception as e:
             print(f"Failed to load sprite {sprite_key}: {e}")
+            image = None
         finally:
+            self._results.put((sprite_key, image))
+    
+    def _drain_results(self):
+        """Apply up to _DRAIN_BATCH_SIZE finished sprites on the UI thread, rescheduling while loads remain."""
+        self._drain_pending = None
+        finished = False
+        for _ in range(_DRAIN_BATCH_SIZE):
+            try:
+                sprite_key, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+            finished = True
             self.loading.discard(sprite_key)
             self.active_loads -= 1
-            self.root.after(50, self._process_queue)
+            if image is not None:
+                ctk_image = ctk.CTkImage(light_image=image, size=SPRITE_SIZE)
+                self._cache_put(sprite_key, ctk_image)
+                self._update_label(sprite_key, ctk_image)
+        
+        # Newly resolved variant URLs are written once things settle. The flag is peeked without the
+        # lock; a stale read only delays the save, and _save_url_cache re-checks it under the lock.
+        if self._url_cache_dirty and self._url_save_pending is None:
+            self._url_save_pending = self.root.after(2000, self._save_url_cache)
+        
+        # Freed worker slots can take the next queued sprites
+        if finished and (self._visible_q or self._bulk_q):
+            self._process_queue()
+        if self.active_loads and self._drain_pending is None:
+            self._drain_pending = self.root.after(_DRAIN_INTERVAL_MS, self._drain_results)
     
     def _update_label(self, sprite_key: str, image: ctk.CTkImage):
         """Update sprite label with loaded image."""
@@ -256,17 +465,33 @@ class LazyLoadSpriteManager:
         except:
             pass
     
-    def clear_cache(self):
-        """Clear sprite cache, keeping only visible sprites."""
-        new_cache = {}
-        for key in self.visible_sprites:
-            if key in self.cache:
-                new_cache[key] = self.cache[key]
-        self.cache = new_cache
+    def _cache_put(self, sprite_key: str, image: ctk.CTkImage) -> None:
+        """Insert into the memory cache, evicting least-recently-used sprites past MAX_SPRITE_CACHE."""
+        cache = self.cache
+        cache[sprite_key] = image
+        cache.move_to_end(sprite_key)
+        while len(cache) > MAX_SPRITE_CACHE:
+            cache.popitem(last=False)
+    
+    def shutdown(self):
+        """Persist resolved URLs and stop the download workers without waiting for in-flight sprites."""
+        if self._drain_pending is not None:
+            self.root.after_cancel(self._drain_pending)
+        if self._url_save_pending is not None:
+            self.root.after_cancel(self._url_save_pending)
+        self._save_url_cache()
+        self._visible_q.clear()
+        self._bulk_q.clear()
+        self.queued_keys.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
     
     def cancel_pending_loads(self):
         """Cancel all pending sprite loads."""
-        self.load_queue.clear()
+        self._visible_q.clear()
+        self._bulk_q.clear()
+        self.queued_keys.clear()
         self.sprite_labels.clear()
     
     def batch_queue_sprites(self, pokemon_sprite_pairs: List[Tuple], mode: Mode, delay_start: int = 0):
@@ -286,13 +511,59 @@ class LazyLoadSpriteManager:
 class DataManager:
     """Handles saving/loading Pokemon data and CSV export."""
     
+    # Background writer: snapshots queue up here and only the newest one is written
+    _save_queue: "queue.Queue[List[dict]]" = queue.Queue()
+    _writer: Optional[threading.Thread] = None
+    _writer_lock = threading.Lock()
+    
+    @classmethod
+    def save_async(cls, pokemon_list: List[Pokemon]) -> None:
+        """Snapshot capture state now and write it to disk on the background writer thread."""
+        # Only mutable state is stored; everything else is regenerated from the database
+        cls._save_queue.put([p.to_persist_dict() for p in pokemon_list])
+        if cls._writer is None:
+            with cls._writer_lock:
+                if cls._writer is None:
+                    cls._writer = threading.Thread(target=cls._writer_loop, name="data-writer", daemon=True)
+                    cls._writer.start()
+    
+    @classmethod
+    def wait_for_saves(cls, timeout: float = _SAVE_WAIT_TIMEOUT) -> bool:
+        """Wait up to timeout seconds for queued snapshots to be written; False if one is still pending."""
+        q = cls._save_queue
+        deadline = time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+    
+    @classmethod
+    def _writer_loop(cls) -> None:
+        """Write queued snapshots, skipping any that a newer one has already superseded."""
+        q = cls._save_queue
+        while True:
+            data = q.get()
+            while True:
+                try:
+                    newer = q.get_nowait()
+                except queue.Empty:
+                    break
+                q.task_done()
+                data = newer
+            cls._write(data)
+            q.task_done()
+    
     @staticmethod
-    def save(pokemon_list: List[Pokemon]) -> None:
-        """Save Pokemon data to JSON file."""
+    def _write(data: List[dict]) -> None:
+        """Atomically replace the data file with the given records."""
         try:
-            data = [asdict(p) for p in pokemon_list]
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp_path = f"{DATA_FILE}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, DATA_FILE)
         except Exception as e:
             print(f"Error saving data: {e}")
     
@@ -304,18 +575,23 @@ class DataManager:
                 return
             with open(DATA_FILE, 'r', encoding='utf-8') as f:
                 saved_data = json.load(f)
-            saved_dict = {p['display_id']: p for p in saved_data}
-            for pokemon in pokemon_list:
-                if pokemon.display_id in saved_dict:
-                    saved = saved_dict[pokemon.display_id]
-                    pokemon.captured_normal = saved.get('captured_normal', saved.get('captured', False))
-                    pokemon.captured_shiny = saved.get('captured_shiny', False)
+            # Walk the saved records (usually fewer than the full list) and look each one up
+            by_id = {p.display_id: p for p in pokemon_list}
+            for saved in saved_data:
+                pokemon = by_id.get(saved.get('display_id'))
+                if pokemon is None:
+                    continue
+                captured_normal = saved.get('captured_normal')
+                if captured_normal is None:
+                    captured_normal = saved.get('captured', False)  # pre-shiny data files
+                pokemon.captured_normal = captured_normal
+                pokemon.captured_shiny = saved.get('captured_shiny', False)
         except Exception as e:
             print(f"Error loading saved data: {e}")
     
     @staticmethod
-    def export_csv(parent, pokemon_list: List[Pokemon], region: Region, mode: Mode) -> bool:
-        """Export Pokemon data to CSV file."""
+    def ask_csv_path(parent, region: Region, mode: Mode) -> Optional[str]:
+        """Ask where to save a CSV export (UI thread); returns None if the user cancels."""
         timestamp = datetime.now().strftime('%Y-%m-%d')
         default_name = f"pokemon_{mode.value.lower()}_{region.display_name.lower()}_{timestamp}.csv"
         filepath = filedialog.asksaveasfilename(
@@ -327,17 +603,29 @@ class DataManager:
         )
         if not filepath:
             messagebox.showinfo("Export Canceled", "CSV export was canceled.")
-            return False
-        try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Dex Number', 'Pokemon Name', 'Region', 'Mode', 'Captured'])
-                for pokemon in pokemon_list:
-                    captured = 'Yes' if pokemon.is_captured(mode) else 'No'
-                    region_text = pokemon.region if pokemon.is_variant else ""
-                    writer.writerow([pokemon.display_id, pokemon.name, region_text, mode.value, captured])
-            messagebox.showinfo("Success", f"CSV saved as:\n{filepath}")
-            return True
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save CSV:\n{e}")
-            return False
+            return None
+        return filepath
+    
+    @staticmethod
+    def csv_rows(pokemon_list: List[Pokemon], mode: Mode) -> List[Tuple[str, str, str, str, str]]:
+        """Snapshot the export rows (UI thread), so later capture toggles can't change the file."""
+        mode_text = mode.value
+        shiny = mode is Mode.SHINY
+        return [
+            (
+                p.display_id,
+                p.name,
+                p.region if p.is_variant else "",
+                mode_text,
+                'Yes' if (p.captured_shiny if shiny else p.captured_normal) else 'No'
+            )
+            for p in pokemon_list
+        ]
+    
+    @staticmethod
+    def write_csv(filepath: str, rows: List[Tuple[str, str, str, str, str]]) -> None:
+        """Write snapshotted rows; touches no Tk objects, so it is safe on a worker thread. Raises on I/O errors."""
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Dex Number', 'Pokemon Name', 'Region', 'Mode', 'Captured'])
+            writer.writerows(rows)
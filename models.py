@@ -1,6 +1,6 @@
 """Data models and enums for the Pokemon tracker."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
@@ -37,9 +37,14 @@ class ViewFilter(Enum):
     MISSING = "Missing"
 
 
-@dataclass
+# Lookups for the segmented-button callbacks, which pass display strings
+REGION_BY_NAME = {r.display_name: r for r in Region}
+FILTER_BY_VALUE = {vf.value: vf for vf in ViewFilter}
+
+
+@dataclass(slots=True)
 class Pokemon:
-    """Pokemon data model."""
+    """Pokemon data model (slotted: 1,100+ instances are scanned on every filter pass)."""
     id: int                # base dex number (1..1025)
     display_id: str        # "52" for base, "52-1" for first variant
     name: str
@@ -47,20 +52,33 @@ class Pokemon:
     captured_shiny: bool = False
     is_variant: bool = False
     region: Optional[str] = None  # "Alolan", "Galarian", etc.
+    # Render strings, fixed at construction (name/region/display_id never change afterwards)
+    display_name: str = field(init=False, repr=False, compare=False)
+    hash_id: str = field(init=False, repr=False, compare=False)  # "#52-1"
+    
+    def __post_init__(self) -> None:
+        self.display_name = f"{self.name} ({self.region})" if self.is_variant and self.region else self.name
+        self.hash_id = f"#{self.display_id}"
     
     def is_captured(self, mode: Mode) -> bool:
         """Check if Pokemon is captured in the given mode."""
-        return self.captured_shiny if mode == Mode.SHINY else self.captured_normal
+        return self.captured_shiny if mode is Mode.SHINY else self.captured_normal
     
     def set_captured(self, mode: Mode, value: bool) -> None:
         """Set Pokemon capture status for the given mode."""
-        if mode == Mode.SHINY:
+        if mode is Mode.SHINY:
             self.captured_shiny = value
         else:
             self.captured_normal = value
     
+    def to_persist_dict(self) -> dict:
+        """Return the mutable state written to the data file (legacy-compatible record)."""
+        return {
+            'display_id': self.display_id,
+            'captured_normal': self.captured_normal,
+            'captured_shiny': self.captured_shiny
+        }
+    
     def get_display_name(self) -> str:
         """Get the display name with regional variant if applicable."""
-        if self.is_variant and self.region:
-            return f"{self.name} ({self.region})"
-        return self.name
+        return self.display_name